@@ -1,10 +1,12 @@
 import streamlit as st
-from core.parser import parse_router_config
+from core.parser import parse_configs
 from core.topo import build_topology
 from core.validate import validate_configs
 from core.perf import analyze_performance
 from core.simulate import simulate_traffic, vlan_reachability, simulate_failure, simulate_vlan_failure, bandwidth_utilization, route_convergence
 from core.export import export_csv, export_excel
+from core.reliability import monte_carlo_availability
+from core.jobs import JobRunner, topology_hash
 import networkx as nx
 import matplotlib.pyplot as plt
 from pyvis.network import Network
@@ -14,12 +16,71 @@ from io import BytesIO
 # Ensure reports folder exists
 os.makedirs("reports", exist_ok=True)
 
-# Load devices and topology
-devices = [parse_router_config("configs/R1.txt"),
-           parse_router_config("configs/R2.txt"),
-           parse_router_config("configs/SW1.txt")]
+# Load devices and topology (vendor auto-detected, parsed in parallel once;
+# Streamlit reruns the script on every interaction)
+@st.cache_data
+def load_devices(paths):
+    return parse_configs(list(paths))
+
+devices = load_devices(("configs/R1.txt", "configs/R2.txt", "configs/SW1.txt"))
 G = build_topology(devices)
 
+# Long analyses run in the background; the runner survives Streamlit reruns
+@st.cache_resource
+def get_job_runner():
+    return JobRunner(os.path.join("reports", "jobs"))
+
+runner = get_job_runner()
+topo_hash = topology_hash(G)
+
+def advanced_simulations(G, samples=2000, link_failure_prob=0.01, progress=None):
+    report = {"bandwidth_utilization": bandwidth_utilization(G)}
+    if progress:
+        progress(0.05, "Route convergence")
+    report["route_convergence"] = {"OSPF": route_convergence(G, "OSPF"), "BGP": route_convergence(G, "BGP")}
+    report["availability"] = monte_carlo_availability(
+        G, link_failure_prob=link_failure_prob, samples=samples, seed=42, max_workers=1,
+        progress=(lambda f, msg: progress(0.1 + 0.9 * f, f"Availability: {msg}")) if progress else None
+    )
+    return report
+
+def run_job(name, func, params=None):
+    """
+    Show a background job's state for the current topology: a Run button
+    when there is no result yet, progress/cancel while it runs, and the
+    result (fresh or reused from disk) once it is done.
+    """
+    params = params or {}
+    job_id = runner.job_id(name, params, topo_hash)
+    status = runner.status(job_id)
+
+    if status is None or status["status"] in ("failed", "cancelled"):
+        if status and status["status"] == "failed":
+            st.error(status["error"])
+        elif status:
+            st.info("Job was cancelled")
+        if st.button(f"Run {name}"):
+            runner.submit(name, func, G, params)
+            status = runner.status(job_id)
+
+    if status and status["status"] in ("queued", "running"):
+        st.progress(status["progress"], text=f"{status['status']}: {status['message']}")
+        col1, col2 = st.columns(2)
+        if col1.button("Refresh"):
+            st.rerun()
+        if col2.button("Cancel"):
+            runner.cancel(job_id)
+            st.rerun()
+        return None
+
+    if status and status["status"] == "done":
+        if st.button(f"Re-run {name}"):
+            runner.forget(job_id)
+            runner.submit(name, func, G, params)
+            st.rerun()
+        return runner.result(job_id)
+    return None
+
 st.title("VIPNet Network Simulator")
 st.sidebar.header("Simulation Options")
 
@@ -39,8 +100,9 @@ if simulation_type == "Validation":
 
 elif simulation_type == "Performance":
     st.subheader("Performance Report")
-    perf_report = analyze_performance(G)
-    st.json(perf_report)
+    perf_report = run_job("performance", analyze_performance)
+    if perf_report is not None:
+        st.json(perf_report)
 
 elif simulation_type == "Traffic":
     st.subheader("Traffic Simulation")
@@ -74,15 +136,20 @@ elif simulation_type == "VLAN Failure":
         st.json(vlan_result)
 
 elif simulation_type == "Advanced Simulations":
-    st.subheader("Bandwidth Utilization")
-    bw_report = bandwidth_utilization(G)
-    st.json(bw_report)
-
-    st.subheader("Route Convergence")
-    ospf_report = route_convergence(G, "OSPF")
-    bgp_report = route_convergence(G, "BGP")
-    st.write("OSPF:", ospf_report)
-    st.write("BGP:", bgp_report)
+    samples = st.sidebar.number_input("Availability samples", min_value=100, value=2000, step=100)
+    link_p = st.sidebar.number_input("Link failure probability", min_value=0.0, max_value=1.0, value=0.01, format="%.4f")
+    adv_report = run_job("advanced simulations", advanced_simulations,
+                         {"samples": int(samples), "link_failure_prob": float(link_p)})
+    if adv_report is not None:
+        st.subheader("Bandwidth Utilization")
+        st.json(adv_report["bandwidth_utilization"])
+
+        st.subheader("Route Convergence")
+        st.write("OSPF:", adv_report["route_convergence"]["OSPF"])
+        st.write("BGP:", adv_report["route_convergence"]["BGP"])
+
+        st.subheader("Availability (Monte Carlo)")
+        st.json(adv_report["availability"])
 
 # ------------------------------
 # Network Topology Visualization
@@ -0,0 +1,193 @@
+import sys
+from ipaddress import IPv4Address
+
+_MASKS = [(0xFFFFFFFF << (32 - p)) & 0xFFFFFFFF for p in range(33)]
+
+
+def _ip_to_int(ip):
+    return int(IPv4Address(ip)) if ip else None
+
+
+def _int_to_ip(value):
+    # Formatted directly; IPv4Address() dominates item access otherwise
+    if value is None:
+        return None
+    return f"{value >> 24}.{(value >> 16) & 255}.{(value >> 8) & 255}.{value & 255}"
+
+
+def _intern(value):
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+class CompactInterface:
+    """
+    Slotted interface record. IPs are stored as ints and repeated strings
+    are interned; item access returns the same values as the dict
+    produced by parse_router_config, so existing code can read it.
+    """
+    __slots__ = ("name", "description", "ip", "prefixlen", "mtu", "bandwidth", "vlans", "mode")
+
+    def __init__(self, name, description=None, ip=None, prefixlen=None,
+                 mtu=None, bandwidth=None, vlans=(), mode=None):
+        self.name = _intern(name)
+        self.description = _intern(description)
+        self.ip = ip
+        self.prefixlen = prefixlen
+        self.mtu = mtu
+        self.bandwidth = bandwidth
+        self.vlans = tuple(vlans)
+        self.mode = _intern(mode)
+
+    @classmethod
+    def from_dict(cls, iface):
+        return cls(
+            iface["name"],
+            description=iface["description"],
+            ip=_ip_to_int(iface["ip"]),
+            prefixlen=iface["prefixlen"],
+            mtu=iface["mtu"],
+            bandwidth=iface["bandwidth"],
+            vlans=iface["vlans"],
+            mode=iface["mode"],
+        )
+
+    @property
+    def network_int(self):
+        if self.ip is None or self.prefixlen is None:
+            return None
+        return self.ip & _MASKS[self.prefixlen]
+
+    _PLAIN = frozenset(("name", "description", "prefixlen", "mtu", "bandwidth", "mode"))
+
+    def __getitem__(self, key):
+        if key in self._PLAIN:
+            return getattr(self, key)
+        if key == "ip":
+            return _int_to_ip(self.ip)
+        if key == "mask":
+            return _int_to_ip(_MASKS[self.prefixlen]) if self.prefixlen is not None else None
+        if key == "network":
+            net = self.network_int
+            return f"{_int_to_ip(net)}/{self.prefixlen}" if net is not None else None
+        if key == "vlans":
+            return list(self.vlans)
+        raise KeyError(key)
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def to_dict(self):
+        return {k: self[k] for k in ("name", "description", "ip", "mask", "prefixlen",
+                                     "network", "mtu", "bandwidth", "vlans", "mode")}
+
+    def __getstate__(self):
+        return tuple(getattr(self, k) for k in self.__slots__)
+
+    def __setstate__(self, state):
+        for k, v in zip(self.__slots__, state):
+            setattr(self, k, v)
+
+    def __repr__(self):
+        return f"CompactInterface({self.name!r}, network={self['network']!r})"
+
+
+def _pack_routing(protocols):
+    ospf = tuple(
+        tuple((_intern(n["network"]), _intern(n["wildcard"]), _intern(n["area"])) for n in proc["networks"])
+        for proc in protocols.get("ospf", [])
+    )
+    bgp = tuple(
+        (proc["asn"], tuple((_ip_to_int(n["ip"]), n["remote_as"]) for n in proc["neighbors"]))
+        for proc in protocols.get("bgp", [])
+    )
+    static = tuple(
+        (_intern(r["prefix"]), _intern(r["mask"]), _intern(r["next_hop"]))
+        for r in protocols.get("static", [])
+    )
+    return ospf, bgp, static
+
+
+def _unpack_routing(packed):
+    ospf, bgp, static = packed
+    return {
+        "ospf": [{"networks": [{"network": n, "wildcard": w, "area": a} for n, w, a in proc]}
+                 for proc in ospf],
+        "bgp": [{"asn": asn, "neighbors": [{"ip": _int_to_ip(ip), "remote_as": ras} for ip, ras in nbrs]}
+                for asn, nbrs in bgp],
+        "static": [{"prefix": p, "mask": m, "next_hop": nh} for p, m, nh in static],
+    }
+
+
+class CompactDevice:
+    """
+    Slotted device record holding CompactInterface objects, VLANs as
+    (id, name) tuples and routing protocols as nested tuples.
+    Item access mirrors the parse_router_config dict.
+    """
+    __slots__ = ("hostname", "interfaces", "vlans", "routing", "cdp", "lldp")
+
+    def __init__(self, hostname, interfaces=(), vlans=(), routing=((), (), ()), cdp=False, lldp=False):
+        self.hostname = _intern(hostname)
+        self.interfaces = tuple(interfaces)
+        self.vlans = tuple(vlans)
+        self.routing = routing
+        self.cdp = cdp
+        self.lldp = lldp
+
+    @classmethod
+    def from_dict(cls, dev):
+        return cls(
+            dev["hostname"],
+            interfaces=[CompactInterface.from_dict(i) for i in dev["interfaces"]],
+            vlans=[(v["id"], _intern(v["name"])) for v in dev["vlans"]],
+            routing=_pack_routing(dev["routing_protocols"]),
+            cdp=dev["features"]["cdp"],
+            lldp=dev["features"]["lldp"],
+        )
+
+    def __getitem__(self, key):
+        if key == "hostname":
+            return self.hostname
+        if key == "interfaces":
+            return list(self.interfaces)
+        if key == "vlans":
+            return [{"id": vid, "name": name} for vid, name in self.vlans]
+        if key == "routing_protocols":
+            return _unpack_routing(self.routing)
+        if key == "features":
+            return {"cdp": self.cdp, "lldp": self.lldp}
+        raise KeyError(key)
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def to_dict(self):
+        return {
+            "hostname": self.hostname,
+            "interfaces": [i.to_dict() for i in self.interfaces],
+            "vlans": self["vlans"],
+            "routing_protocols": self["routing_protocols"],
+            "features": self["features"],
+        }
+
+    def __getstate__(self):
+        return tuple(getattr(self, k) for k in self.__slots__)
+
+    def __setstate__(self, state):
+        for k, v in zip(self.__slots__, state):
+            setattr(self, k, v)
+
+    def __repr__(self):
+        return f"CompactDevice({self.hostname!r}, interfaces={len(self.interfaces)})"
+
+
+def compact_devices(devices):
+    """Convert parsed device dicts into CompactDevice records."""
+    return [dev if isinstance(dev, CompactDevice) else CompactDevice.from_dict(dev)
+            for dev in devices]
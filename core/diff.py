@@ -0,0 +1,223 @@
+import networkx as nx
+from core.fastgraph import freeze_topology
+from core.perf import edge_bottlenecks
+from core.simulate import simulate_traffic
+
+# -----------------------------
+# Snapshot diffing
+# -----------------------------
+def _normalize(d):
+    """Make attribute dicts comparable regardless of list ordering"""
+    return {k: tuple(sorted(v)) if isinstance(v, (list, set)) else v for k, v in d.items()}
+
+_PER_ENDPOINT = ("mtu", "bandwidth", "interfaces")
+
+def _edge_key(u, v, key=None):
+    pair = (u, v) if str(u) <= str(v) else (v, u)
+    return pair if key is None else pair + (key,)
+
+def _edge_entry(u, v, key, d):
+    """
+    Canonical (key, data) for one link, with endpoints in hostname order so
+    the diff does not depend on device order. Per-endpoint tuples and the
+    "<if1>|<if2>" multigraph key are swapped along with the endpoints.
+    """
+    if str(u) <= str(v):
+        return _edge_key(u, v, key), d
+    d = {k: tuple(reversed(val)) if k in _PER_ENDPOINT and isinstance(val, (list, tuple)) else val
+         for k, val in d.items()}
+    if key is not None and "interfaces" in d:
+        key = "|".join(d["interfaces"])
+    return _edge_key(u, v, key), d
+
+def _edge_map(G):
+    # Multigraph links are keyed (u, v, key) so parallel links diff separately
+    if G.is_multigraph():
+        return dict(_edge_entry(u, v, k, d) for u, v, k, d in G.edges(keys=True, data=True))
+    return dict(_edge_entry(u, v, None, d) for u, v, d in G.edges(data=True))
+
+def _link_data(G, link, order):
+    """
+    Data of a diff link key as _edge_map sees it. build_topology stores a
+    link in device (node) order, so the stored endpoints, key and
+    per-endpoint tuples are swapped back when that order differs.
+    """
+    u, v = link[:2]
+    key = link[2] if len(link) > 2 else None
+    if order[u] > order[v]:
+        u, v = v, u
+        if key is not None:
+            key = "|".join(reversed(key.split("|")))
+    d = G.get_edge_data(u, v, key) if key is not None else G.get_edge_data(u, v)
+    return _edge_entry(u, v, key, d)[1]
+
+def _vlan_members(G):
+    members = {}
+    for u, v, d in G.edges(data=True):
+        if d.get("type") == "L2":
+            for vlan in d.get("vlans", []):
+                members.setdefault(vlan, set()).update([u, v])
+    return members
+
+def _diff_maps(old, new):
+    added = sorted(set(new) - set(old), key=str)
+    removed = sorted(set(old) - set(new), key=str)
+    modified = {}
+    for key in set(old) & set(new):
+        if _normalize(old[key]) != _normalize(new[key]):
+            modified[key] = {"old": old[key], "new": new[key]}
+    return {"added": added, "removed": removed, "modified": modified}
+
+def diff_topologies(G_old, G_new):
+    """
+    Compare two graphs from build_topology.
+    Returns added/removed/modified nodes, edges and VLANs, e.g.
+    {"nodes": {"added": [...], "removed": [...], "modified": {n: {"old", "new"}}},
+     "edges": {...keyed by (u, v), or (u, v, key) for multigraphs...},
+     "vlans": {"added": [...], "removed": [...], "modified": {vlan: {"joined", "left"}},
+               "members": {vlan: [...]}}}
+    "members" also covers VLANs whose L2 links changed without any member
+    joining or leaving.
+    """
+    old_edges, new_edges = _edge_map(G_old), _edge_map(G_new)
+    report = {
+        "nodes": _diff_maps(dict(G_old.nodes(data=True)), dict(G_new.nodes(data=True))),
+        "edges": _diff_maps(old_edges, new_edges),
+    }
+
+    # VLANs carried by any changed L2 link, even if no member joined or left
+    # (removing B-C from A-B-C-D splits the VLAN without changing members)
+    touched = set()
+    edges = report["edges"]
+    for data in ([old_edges[k] for k in edges["removed"]] + [new_edges[k] for k in edges["added"]] +
+                 [d for change in edges["modified"].values() for d in change.values()]):
+        if data.get("type") == "L2":
+            touched.update(data.get("vlans", []))
+
+    old_vlans, new_vlans = _vlan_members(G_old), _vlan_members(G_new)
+    modified = {}
+    for vlan in set(old_vlans) & set(new_vlans):
+        if old_vlans[vlan] != new_vlans[vlan]:
+            modified[vlan] = {
+                "joined": sorted(new_vlans[vlan] - old_vlans[vlan], key=str),
+                "left": sorted(old_vlans[vlan] - new_vlans[vlan], key=str),
+            }
+    added = sorted(set(new_vlans) - set(old_vlans))
+    report["vlans"] = {
+        "added": added,
+        "removed": sorted(set(old_vlans) - set(new_vlans)),
+        "modified": modified,
+        # current members of added/modified VLANs and of VLANs on changed
+        # L2 links, for impact_analysis
+        "members": {vlan: sorted(new_vlans[vlan], key=str)
+                    for vlan in set(added) | set(modified) | (touched & set(new_vlans))},
+    }
+    return report
+
+def _as_dict(obj):
+    # Accept both parsed dicts and CompactDevice/CompactInterface records
+    return obj.to_dict() if hasattr(obj, "to_dict") else obj
+
+def diff_devices(old_devices, new_devices):
+    """
+    Compare two sets of parsed devices by hostname. Modified devices list
+    the interfaces that were added, removed or changed.
+    """
+    old = {d["hostname"]: _as_dict(d) for d in old_devices}
+    new = {d["hostname"]: _as_dict(d) for d in new_devices}
+    report = {
+        "added": sorted(set(new) - set(old), key=str),
+        "removed": sorted(set(old) - set(new), key=str),
+        "modified": {},
+    }
+    for host in set(old) & set(new):
+        if old[host] == new[host]:
+            continue
+        old_ifs = {i["name"]: i for i in old[host]["interfaces"]}
+        new_ifs = {i["name"]: i for i in new[host]["interfaces"]}
+        changes = {"interfaces": _diff_maps(old_ifs, new_ifs)}
+        for key in ("vlans", "routing_protocols", "features"):
+            if old[host][key] != new[host][key]:
+                changes[key] = {"old": old[host][key], "new": new[host][key]}
+        report["modified"][host] = changes
+    return report
+
+# -----------------------------
+# Change-impact analysis
+# -----------------------------
+def _vlan_segments(G, vlan, members):
+    """Connected groups of VLAN members over links that carry the VLAN"""
+    H = nx.Graph()
+    H.add_nodes_from(members)
+    for u in members:
+        for v, d in G[u].items():
+            links = d.values() if G.is_multigraph() else [d]
+            if any(l.get("type") == "L2" and vlan in l.get("vlans", []) for l in links):
+                H.add_edge(u, v)
+    return [sorted(c, key=str) for c in nx.connected_components(H)]
+
+def impact_analysis(G_new, diff):
+    """
+    Re-run only the analyses touched by a diff from diff_topologies:
+      - bottlenecks and utilization for added/modified links
+      - redundancy (2-edge-connectivity) between the endpoints of changed
+        links and changed nodes, computed on their components only
+      - rerouting between the endpoints of removed links
+      - reachability (segmentation) of added/modified VLANs and of VLANs
+        carried by added, removed or modified L2 links
+    Bottlenecks, utilization and VLAN segments scale with the size of the
+    change. Redundancy (a bridge scan) and rerouting (a BFS) are linear in
+    the components holding the affected nodes, which on a connected fleet
+    is the whole fleet.
+    """
+    nodes, edges, vlans = diff["nodes"], diff["edges"], diff["vlans"]
+    changed_edges = list(edges["added"]) + list(edges["modified"])
+
+    affected = set(nodes["added"]) | set(nodes["modified"])
+    for link in changed_edges + list(edges["removed"]):
+        affected.update(link[:2])
+    affected = sorted((n for n in affected if n in G_new), key=str)
+
+    bottlenecks = []
+    utilization = {}
+    order = {n: i for i, n in enumerate(G_new)}
+    for link in changed_edges:
+        u, v = link[:2]
+        d = _link_data(G_new, link, order)
+        bottlenecks.extend(edge_bottlenecks(u, v, d))
+        if d["type"] == "L3" and "bandwidth" in d:
+            actual, max_bw = d["bandwidth"]
+            if actual is not None and max_bw is not None:
+                percent = round((actual/max_bw)*100, 2) if max_bw else 0
+                utilization[link] = {"actual_kbps": actual, "max_kbps": max_bw, "util_percent": percent}
+
+    # Redundancy via bridges / 2-edge-connectivity of the affected components:
+    # linear in their size, where enumerating simple paths is exponential
+    component = set()
+    for n in affected:
+        if n not in component:
+            component |= nx.node_connected_component(G_new, n)
+    pairs = [(u, v) for i, u in enumerate(affected) for v in affected[i+1:]]
+    redundancy = freeze_topology(G_new.subgraph(component)).redundancy(pairs) if pairs else {}
+
+    rerouting = {}
+    for link in edges["removed"]:
+        u, v = link[:2]
+        if u in G_new and v in G_new:
+            rerouting[link] = simulate_traffic(G_new, u, v)["path"]
+
+    vlan_reachability = {}
+    for vlan, members in vlans["members"].items():
+        segments = _vlan_segments(G_new, vlan, members)
+        vlan_reachability[vlan] = {"nodes": members, "segments": len(segments)}
+    for vlan in vlans["removed"]:
+        vlan_reachability[vlan] = {"nodes": [], "segments": 0}
+
+    return {
+        "affected_nodes": affected,
+        "bottlenecks": bottlenecks,
+        "bandwidth_utilization": utilization,
+        "redundancy": redundancy,
+        "rerouting": rerouting,
+        "vlan_reachability": vlan_reachability,
+    }
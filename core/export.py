@@ -2,11 +2,11 @@
 import os
 import csv
 
-def _stringify_keys(obj):
+def stringify_keys(obj):
     if isinstance(obj, dict):
-        return {str(k): _stringify_keys(v) for k, v in obj.items()}
+        return {str(k): stringify_keys(v) for k, v in obj.items()}
     elif isinstance(obj, list):
-        return [_stringify_keys(i) for i in obj]
+        return [stringify_keys(i) for i in obj]
     else:
         return obj
 
@@ -99,7 +99,7 @@ def export_csv(reports, outdir="reports"):
     """
     os.makedirs(outdir, exist_ok=True)
     # Ensure keys are JSON/CSV-safe strings
-    safe = _stringify_keys(reports)
+    safe = stringify_keys(reports)
     sheets = _rows_from_reports(safe)
 
     for name, rowlist in sheets.items():
@@ -132,7 +132,7 @@ def export_excel(reports, outfile="network_report.xlsx"):
     except Exception as e:
         return f"Skipped Excel export (pandas not installed): {e}"
 
-    safe = _stringify_keys(reports)
+    safe = stringify_keys(reports)
     sheets = _rows_from_reports(safe)
 
     try:
@@ -0,0 +1,336 @@
+import numpy as np
+
+try:
+    from scipy.sparse import csr_matrix
+    from scipy.sparse.csgraph import connected_components as _cc
+except Exception:  # scipy is optional; pure-Python fallbacks are used instead
+    csr_matrix = None
+
+EDGE_TYPES = ("L2", "L3")
+
+
+class FrozenGraph:
+    """
+    Read-only, integer-indexed snapshot of a topology.
+    Nodes are numbered 0..n-1 (hostnames kept in `nodes`), adjacency is
+    stored as CSR arrays (indptr/indices/edge_ids) and edge attributes as
+    parallel columns indexed by edge id. Results are mapped back to
+    hostnames so they match the NetworkX-based functions.
+    """
+
+    def __init__(self, nodes, device_types, edge_u, edge_v, etype, mtu, bandwidth, subnets, vlans,
+                 keys=None, interfaces=None):
+        self.nodes = list(nodes)
+        self.index = {name: i for i, name in enumerate(self.nodes)}
+        self.device_types = list(device_types)
+        self.edge_u = np.asarray(edge_u, dtype=np.int64)
+        self.edge_v = np.asarray(edge_v, dtype=np.int64)
+        self.etype = np.asarray(etype, dtype=np.int8)
+        self.mtu = np.asarray(mtu, dtype=np.float64).reshape(-1, 2)
+        self.bandwidth = np.asarray(bandwidth, dtype=np.float64).reshape(-1, 2)
+        self.subnets = list(subnets)
+        self.vlans = list(vlans)
+        # Multigraph link keys / interface names (None for simple graphs)
+        self.keys = list(keys) if keys is not None else None
+        self.interfaces = list(interfaces) if interfaces is not None else None
+
+        # CSR adjacency: each undirected edge appears once per direction
+        n = len(self.nodes)
+        src = np.concatenate([self.edge_u, self.edge_v])
+        dst = np.concatenate([self.edge_v, self.edge_u])
+        eid = np.concatenate([np.arange(len(self.edge_u))] * 2)
+        order = np.argsort(src, kind="stable")
+        self.indices = dst[order]
+        self.edge_ids = eid[order]
+        self.indptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(src, minlength=n), out=self.indptr[1:])
+        self._lists = None
+
+    @property
+    def number_of_nodes(self):
+        return len(self.nodes)
+
+    @property
+    def number_of_edges(self):
+        return len(self.edge_u)
+
+    def _adjacency(self):
+        # Plain lists are much faster than numpy scalars in Python loops
+        if self._lists is None:
+            self._lists = (self.indptr.tolist(), self.indices.tolist(), self.edge_ids.tolist())
+        return self._lists
+
+    def _link(self, e):
+        return (self.nodes[self.edge_u[e]], self.nodes[self.edge_v[e]])
+
+    def _suffix(self, e):
+        if self.interfaces is None or self.interfaces[e] is None:
+            return ""
+        return f" ({' / '.join(self.interfaces[e])})"
+
+    # -----------------------------
+    # Traversal
+    # -----------------------------
+    def _expand(self, frontier, seen, other, skip):
+        """Grow one side of a bidirectional BFS; returns (next frontier, meeting node)"""
+        indptr, indices, eids = self._adjacency()
+        nxt = []
+        for u in frontier:
+            for k in range(indptr[u], indptr[u + 1]):
+                w = indices[k]
+                if w in seen or eids[k] in skip:
+                    continue
+                seen[w] = u
+                if w in other:
+                    return nxt, w
+                nxt.append(w)
+        return nxt, None
+
+    def shortest_path(self, src, dst, skip_edges=()):
+        """Hop-count shortest path between hostnames (bidirectional BFS), or None"""
+        s, t = self.index[src], self.index[dst]
+        if s == t:
+            return [src]
+        skip = set(skip_edges)
+        pred, succ = {s: None}, {t: None}
+        fwd, bwd = [s], [t]
+        meet = None
+        while fwd and bwd and meet is None:
+            if len(fwd) <= len(bwd):
+                fwd, meet = self._expand(fwd, pred, succ, skip)
+            else:
+                bwd, meet = self._expand(bwd, succ, pred, skip)
+        if meet is None:
+            return None
+
+        path = [meet]
+        while pred[path[0]] is not None:
+            path.insert(0, pred[path[0]])
+        while succ[path[-1]] is not None:
+            path.append(succ[path[-1]])
+        return [self.nodes[i] for i in path]
+
+    def edges_between(self, u, v):
+        """Edge ids of all (parallel) links between hostnames u and v"""
+        indptr, indices, eids = self._adjacency()
+        a, b = self.index[u], self.index[v]
+        return [eids[k] for k in range(indptr[a], indptr[a + 1]) if indices[k] == b]
+
+    # -----------------------------
+    # Connectivity
+    # -----------------------------
+    def component_labels(self, skip_edges=()):
+        """Connected-component label per node index, ignoring edge ids in skip_edges"""
+        n = len(self.nodes)
+        keep = np.ones(len(self.edge_u), dtype=bool)
+        keep[list(skip_edges)] = False
+        u, v = self.edge_u[keep], self.edge_v[keep]
+        if csr_matrix is not None:
+            mat = csr_matrix((np.ones(len(u), dtype=np.int8), (u, v)), shape=(n, n))
+            return _cc(mat, directed=False)[1]
+        return np.asarray(union_find(n, u.tolist(), v.tolist()), dtype=np.int64)
+
+    def is_connected(self):
+        if not self.nodes:
+            return False
+        return len(set(self.component_labels().tolist())) == 1
+
+    def bridge_ids(self):
+        """Edge ids whose removal disconnects the graph (parallel links are never bridges)"""
+        indptr, indices, eids = self._adjacency()
+        n = len(self.nodes)
+        disc = [-1] * n
+        low = [0] * n
+        timer = 0
+        bridges = []
+        for root in range(n):
+            if disc[root] != -1:
+                continue
+            disc[root] = low[root] = timer
+            timer += 1
+            stack = [[root, -1, indptr[root]]]
+            while stack:
+                frame = stack[-1]
+                u, parent_edge, k = frame
+                if k < indptr[u + 1]:
+                    frame[2] = k + 1
+                    e = eids[k]
+                    if e == parent_edge:
+                        continue
+                    w = indices[k]
+                    if disc[w] == -1:
+                        disc[w] = low[w] = timer
+                        timer += 1
+                        stack.append([w, e, indptr[w]])
+                    elif disc[w] < low[u]:
+                        low[u] = disc[w]
+                else:
+                    stack.pop()
+                    if stack:
+                        p = stack[-1][0]
+                        if low[u] < low[p]:
+                            low[p] = low[u]
+                        if low[u] > disc[p]:
+                            bridges.append(parent_edge)
+        return bridges
+
+    def bridges(self):
+        return [self._link(e) for e in self.bridge_ids()]
+
+    # -----------------------------
+    # Analyses (same output shape as core.perf / core.simulate)
+    # -----------------------------
+    def bottlenecks(self):
+        l3 = self.etype == EDGE_TYPES.index("L3")
+        mtu = np.nan_to_num(self.mtu, nan=1500).min(axis=1)
+        bw = np.nan_to_num(self.bandwidth, nan=1000000).min(axis=1)
+        low_mtu = l3 & (mtu < 1500)
+        low_bw = l3 & (bw < 1000000)
+        out = []
+        for e in np.flatnonzero(low_mtu | low_bw).tolist():
+            u, v = self._link(e)
+            if low_mtu[e]:
+                out.append((u, v, "MTU mismatch" + self._suffix(e)))
+            if low_bw[e]:
+                out.append((u, v, "Low bandwidth" + self._suffix(e)))
+        return out
+
+    def two_edge_components(self):
+        """Groups of hostnames that no single link failure can separate"""
+        groups = {}
+        for i, label in enumerate(self.component_labels(skip_edges=self.bridge_ids()).tolist()):
+            groups.setdefault(label, []).append(self.nodes[i])
+        return list(groups.values())
+
+    def redundancy(self, pairs):
+        """
+        Redundancy of the given (u, v) hostname pairs based on
+        2-edge-connectivity: a pair is redundant when no single link
+        failure can separate it. Unlike core.perf this does not enumerate
+        simple paths, so it scales, but its labels differ: "Multiple
+        link-disjoint paths (redundant)", "Single link failure disconnects
+        (no redundancy)" or "No path", with no path counts.
+        """
+        cc = self.component_labels().tolist()
+        two_ecc = self.component_labels(skip_edges=self.bridge_ids()).tolist()
+        report = {}
+        for u, v in pairs:
+            i, j = self.index[u], self.index[v]
+            if cc[i] != cc[j]:
+                report[(u, v)] = "No path"
+            elif two_ecc[i] == two_ecc[j]:
+                report[(u, v)] = "Multiple link-disjoint paths (redundant)"
+            else:
+                report[(u, v)] = "Single link failure disconnects (no redundancy)"
+        return report
+
+    def analyze_performance(self, pairs=None):
+        """
+        Connectivity and bottlenecks as in core.perf. Instead of an n²
+        pairwise redundancy map it returns the bridges and the
+        2-edge-connected components; "redundancy" only covers the given
+        pairs, with the labels of redundancy().
+        """
+        return {
+            "connected": self.is_connected(),
+            "bottlenecks": self.bottlenecks(),
+            "bridges": self.bridges(),
+            "two_edge_components": self.two_edge_components(),
+            "redundancy": self.redundancy(pairs) if pairs else {},
+        }
+
+    def bandwidth_utilization(self):
+        actual, max_bw = self.bandwidth[:, 0], self.bandwidth[:, 1]
+        mask = (self.etype == EDGE_TYPES.index("L3")) & ~np.isnan(actual) & ~np.isnan(max_bw)
+        ids = np.flatnonzero(mask)
+        actual, max_bw = actual[ids], max_bw[ids]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            percent = np.where(max_bw > 0, np.round(actual / max_bw * 100, 2), 0)
+        names = self.nodes
+        keys = [self.keys[e] for e in ids.tolist()] if self.keys is not None else [None] * len(ids)
+        return {
+            ((names[u], names[v], k) if k is not None else (names[u], names[v])):
+                {"actual_kbps": a, "max_kbps": m, "util_percent": p}
+            for u, v, k, a, m, p in zip(self.edge_u[ids].tolist(), self.edge_v[ids].tolist(), keys,
+                                        actual.astype(np.int64).tolist(), max_bw.astype(np.int64).tolist(),
+                                        percent.tolist())
+        }
+
+    def simulate_traffic(self, src, dst):
+        return {"src": src, "dst": dst, "path": self.shortest_path(src, dst)}
+
+    def simulate_failure(self, failed_link, src, dst):
+        """
+        Like core.simulate.simulate_failure, but skips the edge instead of
+        copying the graph. failed_link is (u, v) or (u, v, key); a bare pair
+        fails one parallel link, the last one added, as nx remove_edge does.
+        """
+        u, v = failed_link[:2]
+        failed = self.edges_between(u, v) if u in self.index and v in self.index else []
+        if len(failed_link) > 2:
+            failed = [e for e in failed if self.keys is not None and self.keys[e] == failed_link[2]]
+        if not failed:
+            return {"error": f"Link {failed_link} not found in topology"}
+        path = self.shortest_path(src, dst, skip_edges=[max(failed)])
+        return {
+            "failed_link": failed_link,
+            "src": src,
+            "dst": dst,
+            "status": "Traffic still possible (rerouted)" if path else "Traffic FAILED (no alternate path)",
+            "new_path": path
+        }
+
+
+def union_find(n, us, vs):
+    """Root label per node after merging the edges (us[i], vs[i]); path halving + union by size"""
+    parent = list(range(n))
+    size = [1] * n
+    for a, b in zip(us, vs):
+        while parent[a] != a:
+            parent[a] = parent[parent[a]]
+            a = parent[a]
+        while parent[b] != b:
+            parent[b] = parent[parent[b]]
+            b = parent[b]
+        if a != b:
+            if size[a] < size[b]:
+                a, b = b, a
+            parent[b] = a
+            size[a] += size[b]
+    for i in range(n):
+        root = i
+        while parent[root] != root:
+            root = parent[root]
+        parent[i] = root
+    return parent
+
+
+def _pair(value, default=None):
+    if isinstance(value, (list, tuple)) and len(value) == 2:
+        return [default if x is None else x for x in value]
+    return [default, default]
+
+
+def freeze_topology(G):
+    """Build a FrozenGraph from the graph (or multigraph) returned by build_topology"""
+    nodes = list(G.nodes)
+    index = {n: i for i, n in enumerate(nodes)}
+    device_types = [G.nodes[n].get("device_type") for n in nodes]
+
+    edge_u, edge_v, etype, mtu, bandwidth, subnets, vlans = [], [], [], [], [], [], []
+    keys, interfaces = [], []
+    edges = G.edges(keys=True, data=True) if G.is_multigraph() else ((u, v, None, d) for u, v, d in G.edges(data=True))
+    for u, v, k, d in edges:
+        keys.append(k)
+        interfaces.append(d.get("interfaces"))
+        edge_u.append(index[u])
+        edge_v.append(index[v])
+        etype.append(EDGE_TYPES.index(d.get("type", "L2")))
+        mtu.append(_pair(d.get("mtu"), np.nan))
+        bandwidth.append(_pair(d.get("bandwidth"), np.nan))
+        subnets.append(d.get("subnet"))
+        vlans.append(tuple(d.get("vlans", ())))
+
+    multi = G.is_multigraph()
+    return FrozenGraph(nodes, device_types, edge_u, edge_v, etype, mtu, bandwidth, subnets, vlans,
+                       keys=keys if multi else None, interfaces=interfaces if multi else None)
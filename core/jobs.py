@@ -0,0 +1,185 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from core.export import stringify_keys
+
+
+class JobCancelled(Exception):
+    """Raised from a job's progress callback once cancellation was requested"""
+
+
+def topology_hash(G):
+    """Stable hash of a topology's nodes, links and attributes"""
+    if G.is_multigraph():
+        edges = [(str(u), str(v), str(k), d) for u, v, k, d in G.edges(keys=True, data=True)]
+    else:
+        edges = [(str(u), str(v), "", d) for u, v, d in G.edges(data=True)]
+    edges = sorted((min(u, v), max(u, v), k, d) for u, v, k, d in edges)
+    payload = json.dumps(
+        {"nodes": sorted((str(n), d) for n, d in G.nodes(data=True)), "edges": edges},
+        sort_keys=True, default=str
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class Job:
+    def __init__(self, job_id, name, params, topo_hash):
+        self.id = job_id
+        self.name = name
+        self.params = params
+        self.topology_hash = topo_hash
+        self.status = "queued"  # queued / running / done / failed / cancelled
+        self.progress = 0.0
+        self.message = ""
+        self.result = None
+        self.error = None
+        self.submitted_at = time.time()
+        self.finished_at = None
+        self.cancel_event = threading.Event()
+        self.future = None
+
+    def snapshot(self):
+        return {
+            "id": self.id,
+            "name": self.name,
+            "params": self.params,
+            "topology_hash": self.topology_hash,
+            "status": self.status,
+            "progress": self.progress,
+            "message": self.message,
+            "error": self.error,
+            "submitted_at": self.submitted_at,
+            "finished_at": self.finished_at,
+        }
+
+
+class JobRunner:
+    """
+    Local background runner for long analyses.
+
+    Jobs run on a thread pool and are identified by a hash of
+    (name, params, topology hash), so submitting the same analysis for an
+    unchanged topology returns the existing job or its persisted result.
+    Finished results are written to <store_dir>/<job_id>.json.
+
+    Job functions are called as func(G, progress=callback, **params).
+    They report progress with callback(fraction, message); the callback
+    raises JobCancelled after cancel() so the job stops at the next update.
+    """
+
+    def __init__(self, store_dir=os.path.join("reports", "jobs"), max_workers=2):
+        self.store_dir = store_dir
+        os.makedirs(store_dir, exist_ok=True)
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="vipnet-job")
+        self._jobs = {}
+        self._lock = threading.Lock()
+
+    def job_id(self, name, params=None, topo_hash=None):
+        payload = json.dumps([name, params or {}, topo_hash], sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode()).hexdigest()[:16]
+
+    def _path(self, job_id):
+        return os.path.join(self.store_dir, f"{job_id}.json")
+
+    def _load(self, job_id):
+        path = self._path(job_id)
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def submit(self, name, func, G=None, params=None):
+        params = params or {}
+        topo_hash = topology_hash(G) if G is not None else None
+        job_id = self.job_id(name, params, topo_hash)
+
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job and job.status in ("queued", "running", "done"):
+                return job_id
+            if self._load(job_id) is not None:
+                return job_id
+
+            job = Job(job_id, name, params, topo_hash)
+            self._jobs[job_id] = job
+            job.future = self._pool.submit(self._run, job, func, G)
+        return job_id
+
+    def _run(self, job, func, G):
+        if job.cancel_event.is_set():
+            return
+        job.status = "running"
+
+        def progress(fraction, message=None):
+            if job.cancel_event.is_set():
+                raise JobCancelled(job.id)
+            job.progress = max(0.0, min(1.0, float(fraction)))
+            if message is not None:
+                job.message = message
+
+        try:
+            args = (G,) if G is not None else ()
+            result = func(*args, progress=progress, **job.params)
+        except JobCancelled:
+            job.status = "cancelled"
+        except Exception as e:
+            job.status = "failed"
+            job.error = f"{type(e).__name__}: {e}"
+        else:
+            job.result = stringify_keys(result)
+            job.progress = 1.0
+            job.status = "done"
+        job.finished_at = time.time()
+
+        if job.status == "done":
+            record = job.snapshot()
+            record["result"] = job.result
+            tmp = self._path(job.id) + ".tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(record, f, default=str)
+            os.replace(tmp, self._path(job.id))
+
+    def status(self, job_id):
+        """Current job state, from memory or from a persisted result; None if unknown"""
+        job = self._jobs.get(job_id)
+        if job is not None:
+            return job.snapshot()
+        record = self._load(job_id)
+        if record is not None:
+            record.pop("result", None)
+        return record
+
+    def result(self, job_id):
+        job = self._jobs.get(job_id)
+        if job is not None and job.status == "done":
+            return job.result
+        record = self._load(job_id)
+        return record.get("result") if record else None
+
+    def cancel(self, job_id):
+        job = self._jobs.get(job_id)
+        if job is None or job.status not in ("queued", "running"):
+            return False
+        job.cancel_event.set()
+        if job.future is not None and job.future.cancel():
+            job.status = "cancelled"
+            job.finished_at = time.time()
+        return True
+
+    def forget(self, job_id):
+        """Drop a job and its persisted result so it can be re-run"""
+        self.cancel(job_id)
+        with self._lock:
+            self._jobs.pop(job_id, None)
+        if os.path.exists(self._path(job_id)):
+            os.remove(self._path(job_id))
+
+    def jobs(self):
+        return [job.snapshot() for job in self._jobs.values()]
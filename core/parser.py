@@ -1,4 +1,7 @@
+import os
 import re
+import shlex
+from concurrent.futures import ProcessPoolExecutor
 from ipaddress import IPv4Network
 
 def mask_to_prefixlen(mask: str) -> int:
@@ -11,8 +14,23 @@ def compute_network(ip: str, mask: str) -> str:
     net = IPv4Network(f"{ip}/{prefix}", strict=False)
     return str(net)
 
-def parse_router_config(file_path):
-    router_data = {
+def prefixlen_to_mask(prefixlen: int) -> str:
+    """Convert prefix length to subnet mask (30 -> 255.255.255.252)"""
+    return str(IPv4Network(f"0.0.0.0/{prefixlen}").netmask)
+
+def expand_vlans(spec: str) -> list:
+    """Expand a VLAN list like '10,20,30-32' into [10, 20, 30, 31, 32]"""
+    vlan_list = []
+    for token in spec.split(","):
+        if "-" in token:
+            start, end = map(int, token.split("-"))
+            vlan_list.extend(range(start, end + 1))
+        elif token:
+            vlan_list.append(int(token))
+    return vlan_list
+
+def new_device():
+    return {
         "hostname": None,
         "interfaces": [],
         "vlans": [],
@@ -20,11 +38,283 @@ def parse_router_config(file_path):
         "features": {"cdp": False, "lldp": False}
     }
 
+def new_interface(name):
+    return {
+        "name": name,
+        "description": None,
+        "ip": None,
+        "mask": None,
+        "prefixlen": None,
+        "network": None,
+        "mtu": None,
+        "bandwidth": None,
+        "vlans": [],
+        "mode": None
+    }
+
+def _set_address(iface, address, mask=None):
+    """Fill ip/mask/prefixlen/network from 'ip mask' or 'ip/prefixlen'"""
+    if mask is None:
+        address, prefixlen = address.split("/")
+        mask = prefixlen_to_mask(int(prefixlen))
+    iface["ip"] = address
+    iface["mask"] = mask
+    iface["prefixlen"] = mask_to_prefixlen(mask)
+    iface["network"] = compute_network(address, mask)
+
+# -----------------------------
+# Vendor registry
+# -----------------------------
+PARSERS = {}
+
+def register_parser(vendor, detect):
+    """
+    Register a vendor parser. detect(text) -> bool decides whether the
+    config looks like this vendor; the decorated function takes the list
+    of config lines and returns the normalized device dict.
+    Vendors are tried in registration order.
+    """
+    def wrap(func):
+        PARSERS[vendor] = (detect, func)
+        return func
+    return wrap
+
+def detect_vendor(text):
+    for vendor, (detect, _) in PARSERS.items():
+        if detect(text):
+            return vendor
+    return "ios"
+
+def parse_config_text(text, vendor=None):
+    vendor = vendor or detect_vendor(text)
+    if vendor not in PARSERS:
+        raise ValueError(f"No parser registered for vendor '{vendor}'")
+    _, parse = PARSERS[vendor]
+    return parse(text.splitlines())
+
+def parse_router_config(file_path, vendor=None):
+    """
+    Parse one device config file. The vendor is auto-detected from the
+    content unless given explicitly ("ios", "eos", "junos").
+    """
     with open(file_path, "r") as f:
-        lines = f.readlines()
+        text = f.read()
+    return parse_config_text(text, vendor)
+
+def _parse_one(args):
+    file_path, vendor, compact = args
+    dev = parse_router_config(file_path, vendor)
+    if compact:
+        from core.compact import CompactDevice
+        dev = CompactDevice.from_dict(dev)
+    return dev
+
+def parse_configs(file_paths, vendor=None, max_workers=None, compact=False):
+    """
+    Bulk ingestion: parse many config files across a process pool.
+    compact=True converts to CompactDevice inside the workers, which
+    keeps the results small when they are pickled back.
+    Results are returned in the same order as file_paths.
+    """
+    jobs = [(path, vendor, compact) for path in file_paths]
+    if max_workers == 1 or len(jobs) <= 1:
+        return [_parse_one(job) for job in jobs]
+
+    workers = max_workers or os.cpu_count() or 1
+    chunksize = max(1, len(jobs) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(_parse_one, jobs, chunksize=chunksize))
+
+# -----------------------------
+# Juniper Junos (set and hierarchical format)
+# -----------------------------
+_JUNOS_TOP = re.compile(r"^\s*(system|interfaces|protocols|vlans|routing-options|chassis)\s*\{", re.M)
+_JUNOS_SET = re.compile(r"^set (system|interfaces|protocols|vlans|routing-options) ", re.M)
+
+def _is_junos(text):
+    return bool(_JUNOS_SET.search(text) or _JUNOS_TOP.search(text))
+
+def _junos_to_set(lines):
+    """Flatten a hierarchical (curly-brace) Junos config into set statements"""
+    statements = []
+    stack = []
+    for line in lines:
+        line = line.split("#", 1)[0].strip()
+        if not line or line.startswith("/*"):
+            continue
+        if line.startswith("set "):
+            statements.append(line)
+        elif line.endswith("{"):
+            stack.append(line[:-1].strip())
+        elif line == "}":
+            if stack:
+                stack.pop()
+        elif line.endswith(";"):
+            statements.append(" ".join(["set"] + stack + [line[:-1].strip()]))
+    return statements
+
+def _junos_bandwidth_kbps(value):
+    units = {"k": 1, "m": 1000, "g": 1000000}
+    value = value.lower()
+    if value[-1] in units:
+        return int(float(value[:-1]) * units[value[-1]])
+    return int(value) // 1000
+
+@register_parser("junos", _is_junos)
+def parse_junos_config(lines):
+    router_data = new_device()
+    interfaces = {}
+    vlan_ids = {}
+    members = {}
+    ospf_areas = {}
+    bgp_groups = {}
+    local_as = None
+
+    for statement in _junos_to_set(lines):
+        try:
+            tokens = shlex.split(statement)[1:]
+        except ValueError:
+            tokens = statement.split()[1:]
+        if len(tokens) < 2:
+            continue
+
+        # Collapse "[ a b c ]" lists into their items
+        values = [t for t in tokens if t not in ("[", "]")]
+
+        if tokens[:2] == ["system", "host-name"]:
+            router_data["hostname"] = tokens[2]
+
+        elif tokens[0] == "interfaces" and tokens[1] != "interface-range":
+            # Logical units are interfaces of their own, named "ge-0/0/0.0"
+            name, rest = tokens[1], tokens[2:]
+            if rest[:1] == ["unit"] and len(rest) > 1:
+                name, rest = f"{name}.{rest[1]}", rest[2:]
+            iface = interfaces.get(name)
+            if iface is None:
+                iface = interfaces[name] = new_interface(name)
+
+            if rest[:1] == ["description"] and len(rest) > 1:
+                iface["description"] = rest[1]
+            elif rest[:1] == ["mtu"]:
+                iface["mtu"] = int(rest[1])
+            elif rest[:1] == ["bandwidth"]:
+                iface["bandwidth"] = _junos_bandwidth_kbps(rest[1])
+            elif rest[:3] == ["family", "inet", "address"]:
+                if iface["ip"] is None:
+                    _set_address(iface, rest[3])
+            elif rest[:2] == ["family", "ethernet-switching"]:
+                iface["mode"] = iface["mode"] or "access"
+                if len(rest) > 3 and rest[2] in ("interface-mode", "port-mode"):
+                    iface["mode"] = rest[3]
+                elif rest[2:4] == ["vlan", "members"]:
+                    members.setdefault(name, []).extend(values[values.index("members") + 1:])
+
+        elif tokens[0] == "vlans" and len(tokens) > 3 and tokens[2] == "vlan-id":
+            vlan_ids[tokens[1]] = int(tokens[3])
+
+        elif tokens[:3] == ["protocols", "ospf", "area"] and len(tokens) > 5 and tokens[4] == "interface":
+            ospf_areas.setdefault(tokens[3], []).append(tokens[5])
+
+        elif tokens[:3] == ["protocols", "bgp", "group"] and len(tokens) > 4:
+            group = bgp_groups.setdefault(tokens[3], {"peer_as": None, "neighbors": {}})
+            if tokens[4] == "peer-as":
+                group["peer_as"] = int(tokens[5])
+            elif tokens[4] == "neighbor":
+                peer_as = int(tokens[7]) if tokens[6:7] == ["peer-as"] else None
+                group["neighbors"].setdefault(tokens[5], peer_as)
+
+        elif tokens[:2] == ["routing-options", "autonomous-system"]:
+            local_as = int(tokens[2])
+
+        elif tokens[:3] == ["routing-options", "static", "route"] and "next-hop" in tokens:
+            net = IPv4Network(tokens[3], strict=False)
+            router_data["routing_protocols"]["static"].append(
+                {"prefix": str(net.network_address), "mask": str(net.netmask),
+                 "next_hop": tokens[tokens.index("next-hop") + 1]}
+            )
+
+        elif tokens[:2] == ["protocols", "lldp"]:
+            router_data["features"]["lldp"] = True
+
+    # Units inherit the port's description, MTU and bandwidth; a port is
+    # only listed itself when it has no units
+    ports = set()
+    for name, iface in interfaces.items():
+        port, dot, _ = name.partition(".")
+        if dot and port in interfaces:
+            ports.add(port)
+            for key in ("description", "mtu", "bandwidth"):
+                if iface[key] is None:
+                    iface[key] = interfaces[port][key]
+    router_data["interfaces"] = [iface for name, iface in interfaces.items() if name not in ports]
+
+    # VLANs, resolving member names to IDs
+    router_data["vlans"] = [{"id": vid, "name": name} for name, vid in vlan_ids.items()]
+    for name, vlan_members in members.items():
+        vlans = []
+        for member in vlan_members:
+            if member in vlan_ids:
+                vlans.append(vlan_ids[member])
+            elif re.fullmatch(r"[\d,-]+", member):
+                vlans.extend(expand_vlans(member))
+        interfaces[name]["vlans"] = vlans
+
+    # OSPF: Junos enables interfaces per area; express them as networks
+    if ospf_areas:
+        networks = []
+        for area, names in ospf_areas.items():
+            for name in names:
+                # "ge-0/0/0" without a unit means unit 0
+                iface = interfaces.get(name) if "." in name else interfaces.get(f"{name}.0", interfaces.get(name))
+                if iface and iface["network"]:
+                    net = IPv4Network(iface["network"])
+                    networks.append({"network": str(net.network_address),
+                                     "wildcard": str(net.hostmask), "area": area})
+        router_data["routing_protocols"]["ospf"].append({"networks": networks})
+
+    for group in bgp_groups.values():
+        if not group["neighbors"]:
+            continue
+        neighbors = [{"ip": ip, "remote_as": peer_as or group["peer_as"]}
+                     for ip, peer_as in group["neighbors"].items()]
+        bgp = router_data["routing_protocols"]["bgp"]
+        if not bgp:
+            bgp.append({"asn": local_as, "neighbors": []})
+        bgp[0]["neighbors"].extend(neighbors)
+
+    return router_data
+
+# -----------------------------
+# Arista EOS (IOS-like syntax, CIDR addresses)
+# -----------------------------
+_EOS_BANNER = re.compile(r"^! device: .*EOS", re.M)
+_EOS_INTERFACE = re.compile(r"^interface (Ethernet|Port-Channel|Management)\d+(/\d+)?\s*$", re.M)
+_CIDR_ADDRESS = re.compile(r"^\s*ip address \d+\.\d+\.\d+\.\d+/\d+", re.M)
+
+def _is_eos(text):
+    # IOS also has "interface Ethernet0/0", so without the show-running
+    # banner an EOS interface name alone is not enough; EOS also writes
+    # addresses in CIDR form, which IOS never does
+    if _EOS_BANNER.search(text):
+        return True
+    return bool(_EOS_INTERFACE.search(text) and _CIDR_ADDRESS.search(text))
+
+@register_parser("eos", _is_eos)
+def parse_eos_config(lines):
+    router_data = parse_ios_config(lines)
+    # LLDP is on by default in EOS
+    router_data["features"]["lldp"] = not any(l.strip() == "no lldp run" for l in lines)
+    return router_data
+
+# -----------------------------
+# Cisco IOS (fallback)
+# -----------------------------
+@register_parser("ios", lambda text: True)
+def parse_ios_config(lines):
+    router_data = new_device()
 
     current_interface = None
-    current_vlan = None
+    current_vlans = []
     inside_ospf = False
     inside_bgp = False
 
@@ -37,18 +327,7 @@ def parse_router_config(file_path):
 
         # Interface block
         elif line.startswith("interface"):
-            current_interface = {
-                "name": line.split()[1],
-                "description": None,
-                "ip": None,
-                "mask": None,
-                "prefixlen": None,
-                "network": None,
-                "mtu": None,
-                "bandwidth": None,
-                "vlans": [],
-                "mode": None
-            }
+            current_interface = new_interface(line.split()[1])
             router_data["interfaces"].append(current_interface)
 
         elif line.startswith("description") and current_interface:
@@ -56,11 +335,10 @@ def parse_router_config(file_path):
 
         elif line.startswith("ip address") and current_interface:
             parts = line.split()
-            ip, mask = parts[2], parts[3]
-            current_interface["ip"] = ip
-            current_interface["mask"] = mask
-            current_interface["prefixlen"] = mask_to_prefixlen(mask)
-            current_interface["network"] = compute_network(ip, mask)
+            if "/" in parts[2]:
+                _set_address(current_interface, parts[2])
+            else:
+                _set_address(current_interface, parts[2], parts[3])
 
         elif line.startswith("mtu") and current_interface:
             current_interface["mtu"] = int(line.split()[1])
@@ -75,24 +353,16 @@ def parse_router_config(file_path):
             current_interface["vlans"] = [int(line.split()[-1])]
 
         elif line.startswith("switchport trunk allowed vlan") and current_interface:
-            vlan_list = []
-            tokens = line.split()[-1].split(",")
-            for token in tokens:
-                if "-" in token:
-                    start, end = map(int, token.split("-"))
-                    vlan_list.extend(range(start, end + 1))
-                else:
-                    vlan_list.append(int(token))
-            current_interface["vlans"] = vlan_list
+            current_interface["vlans"] = expand_vlans(line.split()[-1])
 
         # VLAN block
-        elif line.startswith("vlan"):
-            vlan_id = int(line.split()[1])
-            current_vlan = {"id": vlan_id, "name": None}
-            router_data["vlans"].append(current_vlan)
+        elif re.match(r"vlan [\d,-]+$", line):
+            current_vlans = [{"id": vlan_id, "name": None} for vlan_id in expand_vlans(line.split()[1])]
+            router_data["vlans"].extend(current_vlans)
 
-        elif line.startswith("name") and current_vlan:
-            current_vlan["name"] = line.split(" ", 1)[1]
+        elif line.startswith("name") and current_vlans:
+            for vlan in current_vlans:
+                vlan["name"] = line.split(" ", 1)[1]
 
         # Routing protocols
         elif line.startswith("router ospf"):
@@ -102,6 +372,9 @@ def parse_router_config(file_path):
 
         elif inside_ospf and line.startswith("network"):
             parts = line.split()
+            if "/" in parts[1]:
+                net = IPv4Network(parts[1], strict=False)
+                parts = ["network", str(net.network_address), str(net.hostmask)] + parts[2:]
             router_data["routing_protocols"]["ospf"][-1]["networks"].append(
                 {"network": parts[1], "wildcard": parts[2], "area": parts[4]}
             )
@@ -112,7 +385,7 @@ def parse_router_config(file_path):
             asn = int(line.split()[2])
             router_data["routing_protocols"]["bgp"].append({"asn": asn, "neighbors": []})
 
-        elif inside_bgp and line.startswith("neighbor"):
+        elif inside_bgp and line.startswith("neighbor") and "remote-as" in line:
             parts = line.split()
             router_data["routing_protocols"]["bgp"][-1]["neighbors"].append(
                 {"ip": parts[1], "remote_as": int(parts[3])}
@@ -121,6 +394,9 @@ def parse_router_config(file_path):
         # Static route
         elif line.startswith("ip route"):
             parts = line.split()
+            if "/" in parts[2]:
+                net = IPv4Network(parts[2], strict=False)
+                parts = parts[:2] + [str(net.network_address), str(net.netmask)] + parts[3:]
             router_data["routing_protocols"]["static"].append(
                 {"prefix": parts[2], "mask": parts[3], "next_hop": parts[4]}
             )
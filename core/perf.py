@@ -1,6 +1,52 @@
 import networkx as nx
+from core.fastgraph import FrozenGraph
+
+def edge_bottlenecks(u, v, d):
+    """Bottleneck findings for a single link (parallel links name their interfaces)"""
+    found = []
+    if d["type"] == "L3":
+        mtu = d.get("mtu", (1500, 1500))
+        bw = d.get("bandwidth", (1000000, 1000000))
+        suffix = f" ({' / '.join(d['interfaces'])})" if "interfaces" in d else ""
+
+        if min(mtu) < 1500:
+            found.append((u, v, "MTU mismatch" + suffix))
+        if min(bw) < 1000000:
+            found.append((u, v, "Low bandwidth" + suffix))
+    return found
+
+def pair_redundancy(G, u, v, tick=None):
+    """
+    Redundancy status between two nodes, based on the number of simple paths.
+    tick: optional zero-argument callable invoked every 1000 paths, so long
+    enumerations can be interrupted (e.g. by a cancelled job).
+    """
+    try:
+        count = 0
+        for _ in nx.all_simple_paths(G, u, v):
+            count += 1
+            if tick and count % 1000 == 0:
+                tick()
+        if count > 1:
+            return f"{count} paths available (redundant)"
+        elif count:
+            return "Only 1 path (no redundancy)"
+        return "No path"
+    except nx.NetworkXNoPath:
+        return "No path"
+
+def analyze_performance(G, progress=None, pairs=None):
+    """
+    Connectivity, bottlenecks and pairwise redundancy.
+    progress: optional callback(fraction, message) for long runs
+    pairs: (u, v) to check for redundancy; None means every ordered pair.
+    A FrozenGraph reports bridges and 2-edge-connected components instead,
+    with per-pair redundancy only for explicit pairs and in different
+    wording (see FrozenGraph.redundancy).
+    """
+    if isinstance(G, FrozenGraph):
+        return G.analyze_performance(pairs)
 
-def analyze_performance(G):
     report = {}
 
     # 1. Connectivity check
@@ -9,30 +55,22 @@ def analyze_performance(G):
     # 2. Bottleneck detection
     bottlenecks = []
     for u, v, d in G.edges(data=True):
-        if d["type"] == "L3":
-            mtu = d.get("mtu", (1500, 1500))
-            bw = d.get("bandwidth", (1000000, 1000000))
-
-            if min(mtu) < 1500:
-                bottlenecks.append((u, v, "MTU mismatch"))
-            if min(bw) < 1000000:
-                bottlenecks.append((u, v, "Low bandwidth"))
+        bottlenecks.extend(edge_bottlenecks(u, v, d))
 
     report["bottlenecks"] = bottlenecks
 
     # 3. Redundancy / fault-tolerance
     redundancy = {}
-    for u in G.nodes:
-        for v in G.nodes:
-            if u != v:
-                try:
-                    paths = list(nx.all_simple_paths(G, u, v))
-                    if len(paths) > 1:
-                        redundancy[(u, v)] = f"{len(paths)} paths available (redundant)"
-                    else:
-                        redundancy[(u, v)] = "Only 1 path (no redundancy)"
-                except nx.NetworkXNoPath:
-                    redundancy[(u, v)] = "No path"
+    if pairs is None:
+        pairs = [(u, v) for u in G.nodes for v in G.nodes if u != v]
+    total = len(pairs) or 1
+    for done, (u, v) in enumerate(pairs):
+        tick = None
+        if progress:
+            message = f"Redundancy: {u} -> {v}"
+            tick = lambda: progress(done / total, message)
+            tick()
+        redundancy[(u, v)] = pair_redundancy(G, u, v, tick)
     report["redundancy"] = redundancy
 
     return report
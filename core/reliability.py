@@ -0,0 +1,143 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from core.fastgraph import union_find
+
+# Samples per task; fixed so results do not depend on the number of workers
+CHUNK_SIZE = 250
+
+
+def _run_chunk(args):
+    """
+    Evaluate one chunk of failure scenarios. Each sample draws link and
+    device failures, merges the surviving links with union-find and
+    scores connectivity; nothing is copied from the original graph.
+    """
+    n, us, vs, link_p, node_p, pair_a, pair_b, samples, seed_seq = args
+    rng = np.random.default_rng(seed_seq)
+    total_pairs = n * (n - 1) / 2 or 1
+
+    pair_ok = np.zeros(len(pair_a), dtype=np.int64)
+    fail_loss = np.zeros(len(us), dtype=np.float64)
+    fail_count = np.zeros(len(us), dtype=np.int64)
+    loss_sum = 0.0
+    all_connected = 0
+
+    for _ in range(samples):
+        link_down = rng.random(len(us)) < link_p
+        node_up = rng.random(n) >= node_p
+        alive = ~link_down & node_up[us] & node_up[vs]
+
+        labels = np.asarray(union_find(n, us[alive].tolist(), vs[alive].tolist()))
+        up_labels = labels[node_up]
+        sizes = np.bincount(up_labels, minlength=n) if len(up_labels) else np.zeros(1)
+        connected_pairs = float((sizes * (sizes - 1) / 2).sum())
+        loss = 1.0 - connected_pairs / total_pairs
+
+        loss_sum += loss
+        if loss == 0.0:
+            all_connected += 1
+        fail_loss += loss * link_down
+        fail_count += link_down
+        if len(pair_a):
+            pair_ok += (labels[pair_a] == labels[pair_b]) & node_up[pair_a] & node_up[pair_b]
+
+    return samples, loss_sum, all_connected, pair_ok, fail_loss, fail_count
+
+
+def monte_carlo_availability(G, link_failure_prob=0.001, device_failure_prob=0.0, samples=10000,
+                             seed=None, pairs=None, max_workers=None, top_links=10, progress=None):
+    """
+    Estimate availability under random multi-link / multi-device failures.
+
+    Per-link and per-device probabilities default to link_failure_prob /
+    device_failure_prob and can be overridden with a "failure_prob" edge
+    or node attribute. Samples are split into fixed-size chunks with
+    independent seeds spawned from `seed` and spread over a process pool,
+    so a given seed gives the same result for any max_workers.
+
+    pairs: list of (src, dst) whose availability to report. None skips
+           per-pair output, which grows with n² on large fleets; the
+           aggregate metrics always cover all node pairs.
+    progress: optional callback(fraction, message), called per chunk.
+    Returns the mean availability over all pairs, the probability that
+    the whole network stays connected, the links whose failure costs the
+    most connectivity, and the availability of the requested pairs.
+    """
+    nodes = list(G.nodes)
+    index = {name: i for i, name in enumerate(nodes)}
+    n = len(nodes)
+
+    links, us, vs, link_p = [], [], [], []
+    edges = G.edges(keys=True, data=True) if G.is_multigraph() else ((u, v, None, d) for u, v, d in G.edges(data=True))
+    for u, v, k, d in edges:
+        links.append((u, v) if k is None else (u, v, k))
+        us.append(index[u])
+        vs.append(index[v])
+        link_p.append(d.get("failure_prob", link_failure_prob))
+    node_p = [G.nodes[name].get("failure_prob", device_failure_prob) for name in nodes]
+
+    pairs = list(pairs or [])
+    pair_a = np.array([index[a] for a, _ in pairs], dtype=np.int64)
+    pair_b = np.array([index[b] for _, b in pairs], dtype=np.int64)
+
+    us = np.array(us, dtype=np.int64)
+    vs = np.array(vs, dtype=np.int64)
+    link_p = np.array(link_p, dtype=np.float64)
+    node_p = np.array(node_p, dtype=np.float64)
+
+    sizes = [CHUNK_SIZE] * (samples // CHUNK_SIZE)
+    if samples % CHUNK_SIZE:
+        sizes.append(samples % CHUNK_SIZE)
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    tasks = [(n, us, vs, link_p, node_p, pair_a, pair_b, size, s) for size, s in zip(sizes, seeds)]
+
+    results = []
+    if max_workers == 1 or len(tasks) <= 1:
+        for task in tasks:
+            results.append(_run_chunk(task))
+            if progress:
+                progress(len(results) / len(tasks), f"{sum(r[0] for r in results)} samples")
+    else:
+        pool = ProcessPoolExecutor(max_workers=max_workers or os.cpu_count())
+        try:
+            for result in pool.map(_run_chunk, tasks):
+                results.append(result)
+                if progress:
+                    progress(len(results) / len(tasks), f"{sum(r[0] for r in results)} samples")
+        finally:
+            # Drop queued chunks if the caller aborted (e.g. a cancelled job)
+            pool.shutdown(cancel_futures=True)
+
+    total = sum(r[0] for r in results) or 1
+    loss_sum = sum(r[1] for r in results)
+    all_connected = sum(r[2] for r in results)
+    pair_ok = sum((r[3] for r in results), np.zeros(len(pairs), dtype=np.int64))
+    fail_loss = sum((r[4] for r in results), np.zeros(len(links)))
+    fail_count = sum((r[5] for r in results), np.zeros(len(links), dtype=np.int64))
+
+    # Importance: mean connectivity loss when the link is down minus when it is up
+    critical = []
+    for e, link in enumerate(links):
+        down = int(fail_count[e])
+        if down == 0 or down == total:
+            continue
+        loss_down = fail_loss[e] / down
+        loss_up = (loss_sum - fail_loss[e]) / (total - down)
+        critical.append({
+            "link": link,
+            "failure_rate": round(down / total, 6),
+            "importance": round(float(loss_down - loss_up), 6),
+        })
+    critical.sort(key=lambda c: c["importance"], reverse=True)
+
+    return {
+        "samples": total,
+        "seed": seed,
+        "mean_pair_availability": round(float(1.0 - loss_sum / total), 6),
+        "all_connected_probability": round(all_connected / total, 6),
+        "pair_availability": {pair: round(int(ok) / total, 6) for pair, ok in zip(pairs, pair_ok)},
+        "critical_links": critical[:top_links],
+    }
@@ -1,6 +1,9 @@
 import networkx as nx
+from core.fastgraph import FrozenGraph
 
 def simulate_traffic(G, src, dst):
+    if isinstance(G, FrozenGraph):
+        return G.simulate_traffic(src, dst)
     try:
         path = nx.shortest_path(G, src, dst)
         return {"src": src, "dst": dst, "path": path}
@@ -19,9 +22,14 @@ def vlan_reachability(G):
 def simulate_failure(G, failed_link, src, dst):
     """
     Simulate link failure and check if traffic is still possible.
-    failed_link: tuple ("R1", "R2")
+    failed_link: tuple ("R1", "R2"), or ("R1", "R2", key) to fail one
+                 specific parallel link of a multigraph topology; a bare
+                 pair fails only the most recently added parallel link
     src, dst: nodes to test communication
     """
+    if isinstance(G, FrozenGraph):
+        return G.simulate_failure(failed_link, src, dst)
+
     G_copy = G.copy()
     
     if G_copy.has_edge(*failed_link):
@@ -56,12 +64,15 @@ def simulate_vlan_failure(G, vlan_id, removed_from):
     G_copy = G.copy()
 
     if G_copy.has_edge(*removed_from):
-        edge_data = G_copy[removed_from[0]][removed_from[1]]
-        if edge_data.get("type") == "L2" and vlan_id in edge_data.get("vlans", []):
-            # Remove VLAN from this link
-            edge_data["vlans"].remove(vlan_id)
-        else:
+        edge_data = G_copy.get_edge_data(*removed_from)
+        # Multigraphs: prune the VLAN from every parallel link of the pair
+        links = edge_data.values() if G_copy.is_multigraph() and len(removed_from) == 2 else [edge_data]
+        links = [d for d in links if d.get("type") == "L2" and vlan_id in d.get("vlans", [])]
+        if not links:
             return {"error": f"VLAN {vlan_id} not present on link {removed_from}"}
+        for d in links:
+            # Rebind instead of mutating: the copy shares lists with G
+            d["vlans"] = [v for v in d["vlans"] if v != vlan_id]
     else:
         return {"error": f"Link {removed_from} not found"}
 
@@ -86,12 +97,47 @@ def bandwidth_utilization(G):
     Returns bandwidth utilization info for each L3 link.
     Assumes 'bandwidth' field in edge data as tuple (actual, max) in Kbps.
     """
+    if isinstance(G, FrozenGraph):
+        return G.bandwidth_utilization()
+
     report = {}
-    for u, v, d in G.edges(data=True):
+    for edge in _links(G):
+        u, v, d = edge[0], edge[1], edge[-1]
         if d["type"] == "L3" and "bandwidth" in d:
             actual, max_bw = d["bandwidth"]
             percent = round((actual/max_bw)*100, 2) if max_bw else 0
-            report[(u, v)] = {"actual_kbps": actual, "max_kbps": max_bw, "util_percent": percent}
+            # Multigraphs key each parallel link as (u, v, key)
+            report[edge[:-1]] = {"actual_kbps": actual, "max_kbps": max_bw, "util_percent": percent}
+    return report
+
+def _links(G):
+    """(u, v, data) per link, or (u, v, key, data) for multigraphs"""
+    if G.is_multigraph():
+        return G.edges(keys=True, data=True)
+    return G.edges(data=True)
+
+def link_capacity(G):
+    """
+    Aggregate capacity per device pair across all parallel links.
+    Returns {(u, v): {"links", "l3_links", "total_kbps", "min_mtu", "interfaces"}}.
+    Bandwidth is the smaller of the two interface bandwidths per link;
+    L2 links (e.g. trunk bundle members) count towards the total too.
+    """
+    report = {}
+    for u, v, d in G.edges(data=True):
+        pair = (u, v) if (u, v) in report or (v, u) not in report else (v, u)
+        entry = report.setdefault(pair, {"links": 0, "l3_links": 0, "total_kbps": 0, "min_mtu": None, "interfaces": []})
+        entry["links"] += 1
+        if "interfaces" in d:
+            entry["interfaces"].append(d["interfaces"])
+        if d["type"] == "L3":
+            entry["l3_links"] += 1
+        bws = [b for b in d.get("bandwidth", ()) if b is not None]
+        if bws:
+            entry["total_kbps"] += min(bws)
+        mtus = [m for m in d.get("mtu", ()) if m is not None]
+        if mtus and (entry["min_mtu"] is None or min(mtus) < entry["min_mtu"]):
+            entry["min_mtu"] = min(mtus)
     return report
 
 def route_convergence(G, protocol="OSPF"):
@@ -0,0 +1,218 @@
+import json
+import os
+import sqlite3
+import time
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    created_at REAL NOT NULL,
+    label TEXT,
+    topology_hash TEXT
+);
+CREATE TABLE IF NOT EXISTS devices (
+    run_id INTEGER NOT NULL REFERENCES runs(id) ON DELETE CASCADE,
+    hostname TEXT NOT NULL,
+    device_type TEXT,
+    interfaces INTEGER,
+    data TEXT
+);
+CREATE TABLE IF NOT EXISTS edges (
+    run_id INTEGER NOT NULL REFERENCES runs(id) ON DELETE CASCADE,
+    node_u TEXT NOT NULL,
+    node_v TEXT NOT NULL,
+    link_key TEXT NOT NULL DEFAULT '',
+    type TEXT,
+    subnet TEXT,
+    vlans TEXT,
+    mtu INTEGER,
+    bandwidth_kbps INTEGER
+);
+CREATE TABLE IF NOT EXISTS findings (
+    run_id INTEGER NOT NULL REFERENCES runs(id) ON DELETE CASCADE,
+    hostname TEXT,
+    interface TEXT,
+    message TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS bottlenecks (
+    run_id INTEGER NOT NULL REFERENCES runs(id) ON DELETE CASCADE,
+    node_u TEXT NOT NULL,
+    node_v TEXT NOT NULL,
+    issue TEXT
+);
+CREATE TABLE IF NOT EXISTS utilization (
+    run_id INTEGER NOT NULL REFERENCES runs(id) ON DELETE CASCADE,
+    node_u TEXT NOT NULL,
+    node_v TEXT NOT NULL,
+    link_key TEXT NOT NULL DEFAULT '',
+    actual_kbps REAL,
+    max_kbps REAL,
+    util_percent REAL
+);
+CREATE INDEX IF NOT EXISTS idx_runs_time ON runs(created_at);
+CREATE INDEX IF NOT EXISTS idx_devices_host ON devices(hostname, run_id);
+CREATE INDEX IF NOT EXISTS idx_edges_link ON edges(node_u, node_v, link_key, run_id);
+CREATE INDEX IF NOT EXISTS idx_findings_host ON findings(hostname, run_id);
+CREATE INDEX IF NOT EXISTS idx_bottlenecks_link ON bottlenecks(node_u, node_v, run_id);
+CREATE INDEX IF NOT EXISTS idx_util_link ON utilization(node_u, node_v, link_key, run_id);
+-- run_id first: time-window joins from runs and ON DELETE CASCADE
+CREATE INDEX IF NOT EXISTS idx_devices_run ON devices(run_id);
+CREATE INDEX IF NOT EXISTS idx_edges_run ON edges(run_id);
+CREATE INDEX IF NOT EXISTS idx_findings_run ON findings(run_id);
+CREATE INDEX IF NOT EXISTS idx_bottlenecks_run ON bottlenecks(run_id);
+CREATE INDEX IF NOT EXISTS idx_util_run ON utilization(run_id);
+"""
+
+
+def _link(u, v, key=None):
+    # Links are stored with endpoints in sorted order so (R1, R2) == (R2, R1)
+    u, v = (str(u), str(v)) if str(u) <= str(v) else (str(v), str(u))
+    return u, v, "" if key is None else str(key)
+
+
+def _known(values):
+    values = [x for x in (values or ()) if x is not None]
+    return min(values) if values else None
+
+
+class HistoryStore:
+    """
+    Embedded SQLite history of runs: parsed devices, links, validation
+    findings, bottlenecks and bandwidth utilization, one run record each.
+    Every run is written with executemany() in a single transaction.
+    """
+
+    def __init__(self, path=os.path.join("reports", "history.db")):
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.conn = sqlite3.connect(path)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA foreign_keys = ON")
+        self.conn.execute("PRAGMA journal_mode = WAL")
+        self.conn.executescript(SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # -----------------------------
+    # Writing
+    # -----------------------------
+    def record_run(self, devices, G, validation=None, performance=None, utilization=None,
+                   label=None, created_at=None, topology_hash=None):
+        """
+        Store one run and return its id.
+        validation: list from validate_configs; performance: dict from
+        analyze_performance; utilization: dict from bandwidth_utilization.
+        """
+        created_at = time.time() if created_at is None else created_at
+
+        device_rows = []
+        for dev in devices:
+            data = dev.to_dict() if hasattr(dev, "to_dict") else dev
+            node = G.nodes[data["hostname"]] if data["hostname"] in G else {}
+            device_rows.append((data["hostname"], node.get("device_type"), len(data["interfaces"]),
+                                json.dumps(data, default=str)))
+
+        edges = G.edges(keys=True, data=True) if G.is_multigraph() else ((u, v, None, d) for u, v, d in G.edges(data=True))
+        edge_rows = []
+        for u, v, k, d in edges:
+            edge_rows.append(_link(u, v, k) + (
+                d.get("type"), d.get("subnet"), json.dumps(sorted(d.get("vlans", []))),
+                _known(d.get("mtu")), _known(d.get("bandwidth")),
+            ))
+
+        finding_rows = []
+        for message in validation if isinstance(validation, list) else []:
+            target = message.split(" ", 1)[0]
+            host, _, iface = target.partition(":")
+            finding_rows.append((host, iface or None, message))
+
+        bottleneck_rows = [_link(u, v)[:2] + (issue,) for u, v, issue in (performance or {}).get("bottlenecks", [])]
+
+        util_rows = []
+        for link, info in (utilization or {}).items():
+            util_rows.append(_link(*link) + (info["actual_kbps"], info["max_kbps"], info["util_percent"]))
+
+        with self.conn:
+            cur = self.conn.execute(
+                "INSERT INTO runs (created_at, label, topology_hash) VALUES (?, ?, ?)",
+                (created_at, label, topology_hash)
+            )
+            run_id = cur.lastrowid
+            self.conn.executemany(
+                "INSERT INTO devices VALUES (?, ?, ?, ?, ?)", [(run_id,) + r for r in device_rows])
+            self.conn.executemany(
+                "INSERT INTO edges VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", [(run_id,) + r for r in edge_rows])
+            self.conn.executemany(
+                "INSERT INTO findings VALUES (?, ?, ?, ?)", [(run_id,) + r for r in finding_rows])
+            self.conn.executemany(
+                "INSERT INTO bottlenecks VALUES (?, ?, ?, ?)", [(run_id,) + r for r in bottleneck_rows])
+            self.conn.executemany(
+                "INSERT INTO utilization VALUES (?, ?, ?, ?, ?, ?, ?)", [(run_id,) + r for r in util_rows])
+        return run_id
+
+    def delete_before(self, timestamp):
+        """Drop runs older than timestamp (and their rows)"""
+        with self.conn:
+            return self.conn.execute("DELETE FROM runs WHERE created_at < ?", (timestamp,)).rowcount
+
+    # -----------------------------
+    # Queries
+    # -----------------------------
+    def runs(self, limit=50):
+        rows = self.conn.execute(
+            "SELECT * FROM runs ORDER BY created_at DESC LIMIT ?", (limit,))
+        return [dict(r) for r in rows]
+
+    def link_history(self, u, v, key=None):
+        """Utilization of one link over time"""
+        rows = self.conn.execute(
+            """SELECT r.created_at, u.actual_kbps, u.max_kbps, u.util_percent
+               FROM utilization u JOIN runs r ON r.id = u.run_id
+               WHERE u.node_u = ? AND u.node_v = ? AND u.link_key = ?
+               ORDER BY r.created_at""", _link(u, v, key))
+        return [dict(r) for r in rows]
+
+    def device_findings(self, hostname, since=None):
+        rows = self.conn.execute(
+            """SELECT r.created_at, f.interface, f.message
+               FROM findings f JOIN runs r ON r.id = f.run_id
+               WHERE f.hostname = ? AND r.created_at >= ?
+               ORDER BY r.created_at""", (hostname, since or 0))
+        return [dict(r) for r in rows]
+
+    def utilization_growth(self, days=30, min_growth=0.0, now=None):
+        """
+        Links whose utilization grew over the last `days`, comparing the
+        first and latest sample of each link inside the window.
+        Returns rows sorted by growth (percentage points), largest first.
+        """
+        since = (time.time() if now is None else now) - days * 86400
+        rows = self.conn.execute(
+            """WITH w AS (
+                   SELECT u.node_u, u.node_v, u.link_key, u.util_percent, r.created_at,
+                          ROW_NUMBER() OVER (PARTITION BY u.node_u, u.node_v, u.link_key
+                                             ORDER BY r.created_at) AS first_rank,
+                          ROW_NUMBER() OVER (PARTITION BY u.node_u, u.node_v, u.link_key
+                                             ORDER BY r.created_at DESC) AS last_rank
+                   -- CROSS JOIN keeps runs as the outer loop: the time index
+                   -- picks the window, then idx_util_run finds its rows
+                   FROM runs r CROSS JOIN utilization u ON u.run_id = r.id
+                   WHERE r.created_at >= ?
+               )
+               SELECT f.node_u, f.node_v, f.link_key,
+                      f.util_percent AS first_util, l.util_percent AS last_util,
+                      l.util_percent - f.util_percent AS growth,
+                      f.created_at AS first_seen, l.created_at AS last_seen
+               FROM w f JOIN w l
+                    ON f.node_u = l.node_u AND f.node_v = l.node_v AND f.link_key = l.link_key
+               WHERE f.first_rank = 1 AND l.last_rank = 1
+                     AND l.util_percent - f.util_percent > ?
+               ORDER BY growth DESC""", (since, min_growth))
+        return [dict(r) for r in rows]
@@ -1,7 +1,45 @@
 import networkx as nx
+from core.compact import CompactInterface
 
-def build_topology(devices):
-    G = nx.Graph()
+def _iface_keys(iface):
+    """
+    Values the link cases compare, computed once per interface: network
+    key, VLAN set and mode. CompactInterface compares its integer network
+    and VLAN tuple directly instead of formatting strings on every access.
+    """
+    if isinstance(iface, CompactInterface):
+        net = iface.network_int
+        return iface, (net, iface.prefixlen) if net is not None else None, frozenset(iface.vlans), iface.mode
+    return iface, iface["network"], frozenset(iface["vlans"] or ()), iface["mode"]
+
+def build_topology(devices, multigraph=False):
+    """
+    Build the network graph from parsed devices.
+    multigraph=True returns an nx.MultiGraph that keeps every parallel
+    link (keyed by "<if1>|<if2>", with the interface names in the
+    "interfaces" attribute) instead of letting later links overwrite
+    earlier ones between the same pair of devices. In that mode each
+    interface joins at most one L2 link: VLAN overlaps (Case 2) and then
+    router-to-trunk guesses (Case 3) only pair interfaces that no earlier
+    link uses, preferring pairs whose descriptions name the peer.
+    Every link carries per-endpoint "mtu" and "bandwidth" tuples.
+    """
+    G = nx.MultiGraph() if multigraph else nx.Graph()
+    used = set()          # (hostname, interface) already in a link, multigraph only
+    l2_candidates = []    # Case 2 overlaps, resolved after the loop in multigraph mode
+    trunk_guesses = []    # Case 3 candidates, resolved last in multigraph mode
+
+    def add_link(u, v, if1, if2, **attrs):
+        attrs["mtu"] = (if1["mtu"], if2["mtu"])
+        attrs["bandwidth"] = (if1["bandwidth"], if2["bandwidth"])
+        if multigraph:
+            key = f"{if1['name']}|{if2['name']}"
+            if G.has_edge(u, v, key):
+                return
+            G.add_edge(u, v, key=key, interfaces=(if1["name"], if2["name"]), **attrs)
+            used.update([(u, if1["name"]), (v, if2["name"])])
+        else:
+            G.add_edge(u, v, **attrs)
 
     # Step 1: Add devices as nodes
     for dev in devices:
@@ -9,44 +47,57 @@ def build_topology(devices):
         G.add_node(dev["hostname"], device_type=device_type)
 
     # Step 2: Compare devices to find connections
+    ifaces = [[_iface_keys(i) for i in dev["interfaces"]] for dev in devices]
+    vlan_ids = [[v["id"] for v in dev["vlans"]] for dev in devices]
     for i, dev1 in enumerate(devices):
-        for dev2 in devices[i+1:]:
-            for if1 in dev1["interfaces"]:
-                for if2 in dev2["interfaces"]:
+        for j in range(i + 1, len(devices)):
+            dev2 = devices[j]
+            for if1, net1, vlans1, mode1 in ifaces[i]:
+                for if2, net2, vlans2, mode2 in ifaces[j]:
 
                     # --- Case 1: L3 subnet match ---
-                    if if1["network"] and if2["network"]:
-                        if if1["network"] == if2["network"]:
-                            G.add_edge(
-                                dev1["hostname"], dev2["hostname"],
+                    if net1 and net2:
+                        if net1 == net2:
+                            add_link(
+                                dev1["hostname"], dev2["hostname"], if1, if2,
                                 type="L3",
-                                subnet=if1["network"],
-                                mtu=(if1["mtu"], if2["mtu"]),
-                                bandwidth=(if1["bandwidth"], if2["bandwidth"])
+                                subnet=if1["network"]
                             )
 
                     # --- Case 2: VLAN overlap (Switch ↔ Switch) ---
-                    if if1["vlans"] and if2["vlans"]:
-                        common_vlans = set(if1["vlans"]) & set(if2["vlans"])
+                    if vlans1 and vlans2:
+                        common_vlans = vlans1 & vlans2
                         if common_vlans:
-                            G.add_edge(
-                                dev1["hostname"], dev2["hostname"],
-                                type="L2",
-                                vlans=list(common_vlans)
-                            )
+                            if multigraph:
+                                l2_candidates.append((dev1, dev2, if1, if2, list(common_vlans)))
+                            else:
+                                add_link(dev1["hostname"], dev2["hostname"], if1, if2,
+                                         type="L2", vlans=list(common_vlans))
 
                     # --- Case 3: Router ↔ Switch trunk ---
-                    if if1["mode"] == "trunk" and not if2["mode"]:
-                        G.add_edge(
-                            dev1["hostname"], dev2["hostname"],
-                            type="L2",
-                            vlans=[v["id"] for v in dev1["vlans"]] if dev1["vlans"] else []
-                        )
-                    if if2["mode"] == "trunk" and not if1["mode"]:
-                        G.add_edge(
-                            dev1["hostname"], dev2["hostname"],
-                            type="L2",
-                            vlans=[v["id"] for v in dev2["vlans"]] if dev2["vlans"] else []
-                        )
+                    if mode1 == "trunk" and not mode2:
+                        vlans = list(vlan_ids[i])
+                        if multigraph:
+                            trunk_guesses.append((dev1, dev2, if1, if2, vlans))
+                        else:
+                            add_link(dev1["hostname"], dev2["hostname"], if1, if2, type="L2", vlans=vlans)
+                    if mode2 == "trunk" and not mode1:
+                        vlans = list(vlan_ids[j])
+                        if multigraph:
+                            trunk_guesses.append((dev1, dev2, if1, if2, vlans))
+                        else:
+                            add_link(dev1["hostname"], dev2["hostname"], if1, if2, type="L2", vlans=vlans)
+
+    # Step 3 (multigraph): pair each interface with at most one L2 peer,
+    # VLAN overlaps before trunk guesses, description hints first
+    def hint(candidate):
+        dev1, dev2, if1, if2, _ = candidate
+        return (dev2["hostname"] in (if1["description"] or "")) + (dev1["hostname"] in (if2["description"] or ""))
+
+    for candidates in (l2_candidates, trunk_guesses):
+        for dev1, dev2, if1, if2, vlans in sorted(candidates, key=hint, reverse=True):
+            end1, end2 = (dev1["hostname"], if1["name"]), (dev2["hostname"], if2["name"])
+            if end1 not in used and end2 not in used:
+                add_link(dev1["hostname"], dev2["hostname"], if1, if2, type="L2", vlans=vlans)
 
     return G
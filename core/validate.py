@@ -2,9 +2,10 @@ def validate_configs(devices):
     errors = []
 
     for dev in devices:
+        is_router = not dev["vlans"]
         for iface in dev["interfaces"]:
             # Routers should have IPs on L3 interfaces
-            if dev["vlans"] == [] and iface["ip"] is None:
+            if is_router and iface["ip"] is None:
                 errors.append(f"{dev['hostname']}:{iface['name']} has no IP")
 
             # MTU check
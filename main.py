@@ -1,4 +1,4 @@
-from core.parser import parse_router_config
+from core.parser import parse_configs
 from core.topo import build_topology
 import networkx as nx
 import matplotlib.pyplot as plt
@@ -12,22 +12,27 @@ from core.validate import validate_configs
 from core.perf import analyze_performance
 from core.simulate import (
     simulate_traffic, vlan_reachability, simulate_failure, simulate_vlan_failure,
-    bandwidth_utilization, route_convergence
+    bandwidth_utilization, route_convergence, link_capacity
 )
 
+from core.reliability import monte_carlo_availability
+from core.store import HistoryStore
+from core.jobs import topology_hash
+
 # Export
 from core.export import export_csv, export_excel
 
 # PyVis
 from pyvis.network import Network
 
+# Most router pairs the CLI availability command reports individually
+AVAILABILITY_PAIRS = 50
+
 if __name__ == "__main__":
     os.makedirs("reports", exist_ok=True)
 
-    # Step 1: Parse all devices
-    devices = []
-    for fname in ["configs/R1.txt", "configs/R2.txt", "configs/SW1.txt"]:
-        devices.append(parse_router_config(fname))
+    # Step 1: Parse all devices (vendor auto-detected, parsed in parallel)
+    devices = parse_configs(["configs/R1.txt", "configs/R2.txt", "configs/SW1.txt"])
 
     # Step 2: Build topology
     G = build_topology(devices)
@@ -124,6 +129,12 @@ if __name__ == "__main__":
     for link, info in bw_report.items():
         print(f"{link}: {info}")
 
+    # Aggregate capacity, keeping parallel links (LAG members, multiple subnets)
+    capacity_report = link_capacity(build_topology(devices, multigraph=True))
+    print("\nLink Capacity (parallel links aggregated):")
+    for pair, info in capacity_report.items():
+        print(f"{pair}: {info['l3_links']} L3 link(s), {info['total_kbps']} Kbps, min MTU {info['min_mtu']}")
+
     # OSPF/BGP convergence
     ospf_report = route_convergence(G, protocol="OSPF")
     bgp_report = route_convergence(G, protocol="BGP")
@@ -143,6 +154,7 @@ if __name__ == "__main__":
         "failure_simulation": result,
         "vlan_failure_simulation": vlan_result,
         "bandwidth_utilization": bw_report,
+        "link_capacity": capacity_report,
         "route_convergence": {"OSPF": ospf_report, "BGP": bgp_report}
     }
 
@@ -164,6 +176,12 @@ if __name__ == "__main__":
     msg = export_excel(safe_reports, outfile="network_report.xlsx")
     print(f"--- {msg} ---")
 
+    # Keep a history of every run for trend queries
+    with HistoryStore(os.path.join("reports", "history.db")) as store:
+        run_id = store.record_run(devices, G, validation=errors, performance=perf_report,
+                                  utilization=bw_report, topology_hash=topology_hash(G))
+    print(f"--- Run {run_id} recorded in reports/history.db ---")
+
     # -----------------------------
     # Live CLI Input Mode
     # -----------------------------
@@ -185,6 +203,7 @@ vlan_fail <vlan> <dev1> <dev2> - Simulate VLAN failure
 bw_util                    - Show bandwidth utilization
 ospf_conv                  - Simulate OSPF convergence
 bgp_conv                   - Simulate BGP convergence
+availability <p> [samples] - Monte Carlo availability with link failure probability p
 exit / quit                - Exit CLI mode
 """)
             else:
@@ -214,6 +233,19 @@ exit / quit                - Exit CLI mode
                         report = route_convergence(G, "OSPF")
                         table = [[node, time] for node, time in report.items()]
                         print(tabulate(table, headers=["Node", "Convergence Time (ms)"], tablefmt="fancy_grid"))
+                    elif action == "availability" and len(parts) >= 2:
+                        samples = int(parts[2]) if len(parts) > 2 else 10000
+                        # Per-pair output only between routers, and bounded
+                        routers = [n for n, d in G.nodes(data=True) if d.get("device_type") == "router"]
+                        pairs = [(u, v) for i, u in enumerate(routers) for v in routers[i+1:]][:AVAILABILITY_PAIRS]
+                        report = monte_carlo_availability(G, link_failure_prob=float(parts[1]), samples=samples,
+                                                          seed=42, pairs=pairs)
+                        print(f"Mean pair availability: {report['mean_pair_availability']:.4%}, "
+                              f"all connected: {report['all_connected_probability']:.4%}")
+                        table = [[f"{u}-{v}", f"{p:.4%}"] for (u, v), p in report["pair_availability"].items()]
+                        print(tabulate(table, headers=["Router Pair", "Availability"], tablefmt="fancy_grid"))
+                        table = [["-".join(map(str, c["link"])), c["importance"]] for c in report["critical_links"]]
+                        print(tabulate(table, headers=["Critical Link", "Importance"], tablefmt="fancy_grid"))
                     elif action == "bgp_conv":
                         report = route_convergence(G, "BGP")
                         table = [[node, time] for node, time in report.items()]
@@ -0,0 +1,71 @@
+import copy
+from pathlib import Path
+
+import networkx as nx
+import pytest
+
+from core.diff import diff_topologies, impact_analysis
+from core.parser import parse_router_config
+from core.topo import build_topology
+
+CONFIGS = Path(__file__).resolve().parents[2] / "configs"
+
+
+@pytest.fixture
+def devices():
+    devs = [parse_router_config(CONFIGS / f"{h}.txt") for h in ("R1", "R2", "SW1")]
+    devs[1]["interfaces"][0]["mtu"] = 1400
+    return devs
+
+
+# -----------------------------
+# Device order
+# -----------------------------
+@pytest.mark.parametrize("multigraph", [False, True])
+def test_diff_ignores_device_order(devices, multigraph):
+    G_old = build_topology(devices, multigraph=multigraph)
+    G_new = build_topology(devices[::-1], multigraph=multigraph)
+    assert diff_topologies(G_old, G_new)["edges"] == {"added": [], "removed": [], "modified": {}}
+
+
+def test_build_topology_tuples_follow_endpoints(devices):
+    G = build_topology([devices[2], devices[1], devices[0]])
+    for u, v, d in G.edges(data=True):
+        if d["type"] == "L3":
+            assert (u, v, d["mtu"]) == ("R2", "R1", (1400, 1500))
+
+
+@pytest.mark.parametrize("multigraph", [False, True])
+def test_impact_uses_diff_orientation(devices, multigraph):
+    changed = copy.deepcopy(devices)
+    changed[0]["interfaces"][0]["bandwidth"] = 500000
+    G_old = build_topology(devices, multigraph=multigraph)
+    G_new = build_topology(changed[::-1], multigraph=multigraph)
+
+    impact = impact_analysis(G_new, diff_topologies(G_old, G_new))
+    (link, util), = [(k, v) for k, v in impact["bandwidth_utilization"].items() if k[:2] == ("R1", "R2")]
+    assert (util["actual_kbps"], util["max_kbps"]) == (500000, 1000000)
+
+
+# -----------------------------
+# VLAN impact
+# -----------------------------
+def vlan_chain(hostnames, vlan=10):
+    """Switches in a line, each adjacent pair sharing one trunk in `vlan`"""
+    G = nx.Graph()
+    G.add_nodes_from(hostnames, device_type="switch")
+    for u, v in zip(hostnames, hostnames[1:]):
+        G.add_edge(u, v, type="L2", vlans=[vlan], mtu=(1500, 1500), bandwidth=(1000000, 1000000))
+    return G
+
+
+def test_removed_link_splits_vlan():
+    G_old = vlan_chain(["A", "B", "C", "D"])
+    G_new = G_old.copy()
+    G_new.remove_edge("B", "C")
+
+    diff = diff_topologies(G_old, G_new)
+    assert diff["vlans"]["modified"] == {}
+    assert diff["vlans"]["members"] == {10: ["A", "B", "C", "D"]}
+    assert impact_analysis(G_new, diff)["vlan_reachability"] == {
+        10: {"nodes": ["A", "B", "C", "D"], "segments": 2}}
@@ -0,0 +1,53 @@
+from pathlib import Path
+
+import networkx as nx
+import pytest
+
+from core.fastgraph import freeze_topology
+from core.parser import parse_router_config
+from core.perf import analyze_performance
+from core.topo import build_topology
+
+CONFIGS = Path(__file__).resolve().parents[2] / "configs"
+
+
+@pytest.fixture
+def G():
+    devices = [parse_router_config(CONFIGS / f"{h}.txt") for h in ("R1", "R2", "SW1")]
+    G = build_topology(devices)
+    G.add_node("H1", device_type="router")
+    G.add_edge("SW1", "H1", type="L2", vlans=[10])
+    return G
+
+
+def test_frozen_performance_matches_networkx(G):
+    report = analyze_performance(G)
+    frozen = analyze_performance(freeze_topology(G))
+
+    assert frozen["connected"] == report["connected"]
+    assert sorted(frozen["bottlenecks"]) == sorted(report["bottlenecks"])
+    assert [tuple(sorted(b)) for b in frozen["bridges"]] == [("H1", "SW1")]
+    assert sorted(map(sorted, frozen["two_edge_components"])) == [["H1"], ["R1", "R2", "SW1"]]
+    # no n² pair map unless pairs are asked for
+    assert frozen["redundancy"] == {}
+
+
+def test_frozen_redundancy_on_explicit_pairs(G):
+    pairs = [("R1", "R2"), ("R1", "H1")]
+    report = analyze_performance(G, pairs=pairs)
+    frozen = analyze_performance(freeze_topology(G), pairs=pairs)
+
+    assert list(report["redundancy"]) == list(frozen["redundancy"]) == pairs
+    assert report["redundancy"][("R1", "R2")] == "2 paths available (redundant)"
+    assert frozen["redundancy"][("R1", "R2")] == "Multiple link-disjoint paths (redundant)"
+    # path counting sees two paths to H1; 2-edge-connectivity sees the bridge
+    assert report["redundancy"][("R1", "H1")] == "2 paths available (redundant)"
+    assert frozen["redundancy"][("R1", "H1")] == "Single link failure disconnects (no redundancy)"
+
+
+def test_frozen_performance_scales():
+    G = nx.grid_2d_graph(60, 60)
+    nx.set_edge_attributes(G, "L3", "type")
+    report = analyze_performance(freeze_topology(G))
+    assert report["connected"] and report["bridges"] == []
+    assert len(report["two_edge_components"]) == 1
@@ -0,0 +1,113 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from core.parser import detect_vendor, parse_config_text, parse_router_config
+
+ROOT = Path(__file__).resolve().parents[2]
+SAMPLES = Path(__file__).resolve().parent / "configs"
+EXPECTED = Path(__file__).resolve().parent / "expected"
+
+
+def read(path):
+    return Path(path).read_text(encoding="utf-8")
+
+
+# -----------------------------
+# Vendor detection
+# -----------------------------
+@pytest.mark.parametrize("path, vendor", [
+    (ROOT / "configs" / "R1.txt", "ios"),
+    (ROOT / "configs" / "R2.txt", "ios"),
+    (ROOT / "configs" / "SW1.txt", "ios"),
+    (SAMPLES / "ios_R9.txt", "ios"),
+    (SAMPLES / "eos_A1.cfg", "eos"),
+    (SAMPLES / "junos_J1.conf", "junos"),
+    (SAMPLES / "junos_J1.set", "junos"),
+    (SAMPLES / "junos_J3.set", "junos"),
+])
+def test_detect_vendor(path, vendor):
+    assert detect_vendor(read(path)) == vendor
+
+
+def test_eos_detected_without_banner():
+    text = "hostname A2\ninterface Ethernet1\n   no switchport\n   ip address 10.0.0.1/31\n"
+    assert detect_vendor(text) == "eos"
+
+
+def test_ios_ethernet_is_not_eos():
+    dev = parse_router_config(SAMPLES / "ios_R9.txt")
+    assert dev["features"]["lldp"] is False
+    assert [i["name"] for i in dev["interfaces"]] == ["Ethernet0/0", "Ethernet0/1"]
+    assert dev["interfaces"][0]["network"] == "10.0.9.0/24"
+
+
+# -----------------------------
+# IOS output is unchanged from the original parser
+# -----------------------------
+@pytest.mark.parametrize("hostname", ["R1", "R2", "SW1"])
+def test_ios_matches_baseline(hostname):
+    dev = parse_router_config(ROOT / "configs" / f"{hostname}.txt")
+    assert json.loads(json.dumps(dev)) == json.loads(read(EXPECTED / f"{hostname}.json"))
+
+
+# -----------------------------
+# Normalized output
+# -----------------------------
+def test_eos_normalized():
+    dev = parse_router_config(SAMPLES / "eos_A1.cfg")
+    assert dev["hostname"] == "A1"
+    routed, trunk = dev["interfaces"]
+    assert (routed["name"], routed["ip"], routed["mask"], routed["network"], routed["mtu"]) == \
+        ("Ethernet1", "10.0.2.2", "255.255.255.252", "10.0.2.0/30", 9214)
+    assert (trunk["mode"], trunk["vlans"]) == ("trunk", [10, 11])
+    assert [v["id"] for v in dev["vlans"]] == [10, 11]
+    assert dev["routing_protocols"]["ospf"] == [
+        {"networks": [{"network": "10.0.2.0", "wildcard": "0.0.0.3", "area": "0.0.0.0"}]}]
+    assert dev["routing_protocols"]["static"] == [
+        {"prefix": "0.0.0.0", "mask": "0.0.0.0", "next_hop": "10.0.2.1"}]
+    assert dev["features"]["lldp"] is True
+
+
+def test_junos_set_and_hierarchical_agree():
+    assert parse_router_config(SAMPLES / "junos_J1.conf") == parse_router_config(SAMPLES / "junos_J1.set")
+
+
+def test_junos_normalized():
+    dev = parse_router_config(SAMPLES / "junos_J1.conf")
+    assert dev["hostname"] == "J1"
+    routed, trunk = dev["interfaces"]
+    assert routed == {
+        "name": "ge-0/0/0.0", "description": "to R1", "ip": "10.0.1.2", "mask": "255.255.255.252",
+        "prefixlen": 30, "network": "10.0.1.0/30", "mtu": 1500, "bandwidth": 1000000,
+        "vlans": [], "mode": None,
+    }
+    assert (trunk["name"], trunk["mode"], sorted(trunk["vlans"])) == ("ge-0/0/1.0", "trunk", [10, 20])
+    assert sorted(v["id"] for v in dev["vlans"]) == [10, 20]
+    assert dev["routing_protocols"]["ospf"] == [
+        {"networks": [{"network": "10.0.1.0", "wildcard": "0.0.0.3", "area": "0.0.0.0"}]}]
+    assert dev["routing_protocols"]["bgp"] == [
+        {"asn": 65010, "neighbors": [{"ip": "203.0.113.1", "remote_as": 65020}]}]
+    assert dev["routing_protocols"]["static"] == [
+        {"prefix": "0.0.0.0", "mask": "0.0.0.0", "next_hop": "10.0.1.1"}]
+    assert dev["features"]["lldp"] is True
+
+
+def test_junos_units_are_separate_interfaces():
+    dev = parse_router_config(SAMPLES / "junos_J3.set")
+    ifaces = {i["name"]: i for i in dev["interfaces"]}
+    assert list(ifaces) == ["ge-0/0/0.100", "ge-0/0/0.200", "ge-0/0/1"]
+    assert ifaces["ge-0/0/0.100"]["network"] == "10.1.0.0/30"
+    assert ifaces["ge-0/0/0.200"]["network"] == "10.2.0.0/30"
+    # units inherit the port's settings unless they set their own
+    assert ifaces["ge-0/0/0.100"]["description"] == "uplink"
+    assert ifaces["ge-0/0/0.200"]["description"] == "customer B"
+    assert ifaces["ge-0/0/0.100"]["mtu"] == ifaces["ge-0/0/0.200"]["mtu"] == 9000
+    assert dev["routing_protocols"]["ospf"] == [
+        {"networks": [{"network": "10.2.0.0", "wildcard": "0.0.0.3", "area": "0"}]}]
+
+
+def test_explicit_vendor_overrides_detection():
+    text = read(SAMPLES / "ios_R9.txt")
+    assert parse_config_text(text, vendor="eos")["features"]["lldp"] is True
@@ -0,0 +1,72 @@
+from pathlib import Path
+
+import pytest
+
+from core.parser import parse_router_config
+from core.simulate import bandwidth_utilization
+from core.store import HistoryStore
+from core.topo import build_topology
+from core.validate import validate_configs
+
+CONFIGS = Path(__file__).resolve().parents[2] / "configs"
+DAY = 86400
+NOW = 1_700_000_000
+
+
+@pytest.fixture
+def store(tmp_path):
+    with HistoryStore(str(tmp_path / "history.db")) as s:
+        yield s
+
+
+def record(store, devices, created_at):
+    G = build_topology(devices)
+    return store.record_run(devices, G, validation=validate_configs(devices),
+                            utilization=bandwidth_utilization(G), created_at=created_at)
+
+
+@pytest.fixture
+def devices():
+    return [parse_router_config(CONFIGS / f"{h}.txt") for h in ("R1", "R2", "SW1")]
+
+
+def test_record_run(store, devices):
+    run_id = record(store, devices, NOW)
+    assert [r["id"] for r in store.runs()] == [run_id]
+    rows = store.conn.execute("SELECT COUNT(*) FROM edges WHERE run_id = ?", (run_id,)).fetchone()[0]
+    assert rows == build_topology(devices).number_of_edges()
+    assert [h["util_percent"] for h in store.link_history("R2", "R1")] == [100.0]
+
+
+def test_utilization_growth(store, devices):
+    record(store, devices, NOW - 40 * DAY)      # outside the window
+    record(store, devices, NOW - 20 * DAY)
+    devices[0]["interfaces"][0]["bandwidth"] = 1500000
+    record(store, devices, NOW - DAY)
+
+    (row,) = store.utilization_growth(days=30, now=NOW)
+    assert (row["node_u"], row["node_v"]) == ("R1", "R2")
+    assert (row["first_util"], row["last_util"], row["growth"]) == (100.0, 150.0, 50.0)
+    assert row["first_seen"] == NOW - 20 * DAY
+
+    assert store.delete_before(NOW - 30 * DAY) == 1
+    assert store.conn.execute("SELECT COUNT(*) FROM utilization").fetchone()[0] == 2
+
+
+def plan(store, sql, params=()):
+    return " / ".join(r["detail"] for r in store.conn.execute("EXPLAIN QUERY PLAN " + sql, params))
+
+
+def test_queries_use_run_indexes(store):
+    statements = []
+    store.conn.set_trace_callback(statements.append)
+    store.utilization_growth(days=30, now=NOW)
+    store.conn.set_trace_callback(None)
+
+    detail = plan(store, statements[-1])
+    assert "idx_runs_time" in detail and "idx_util_run" in detail
+    # ON DELETE CASCADE looks child rows up by run_id
+    for table, index in [("devices", "idx_devices_run"), ("edges", "idx_edges_run"),
+                         ("findings", "idx_findings_run"), ("bottlenecks", "idx_bottlenecks_run"),
+                         ("utilization", "idx_util_run")]:
+        assert index in plan(store, f"DELETE FROM {table} WHERE run_id = ?", (1,))
@@ -0,0 +1,52 @@
+from core.parser import new_device, new_interface
+from core.simulate import link_capacity
+from core.topo import build_topology
+
+
+def switch(hostname, ports, vlans=(10,), description=None):
+    dev = new_device()
+    dev["hostname"] = hostname
+    dev["vlans"] = [{"id": vid, "name": f"VLAN{vid}"} for vid in vlans]
+    for name, bandwidth, mtu in ports:
+        iface = new_interface(name)
+        iface.update(mode="trunk", vlans=list(vlans), bandwidth=bandwidth, mtu=mtu, description=description)
+        dev["interfaces"].append(iface)
+    return dev
+
+
+# -----------------------------
+# Multigraph trunk bundles
+# -----------------------------
+def test_trunk_bundle_one_link_per_member():
+    ports = [("Gi1/0/1", 1000000, 9000), ("Gi1/0/2", 1000000, 9000), ("Gi1/0/3", 1000000, 1500)]
+    G = build_topology([switch("SW1", ports), switch("SW2", ports)], multigraph=True)
+
+    assert sorted(k for _, _, k in G.edges(keys=True)) == [
+        "Gi1/0/1|Gi1/0/1", "Gi1/0/2|Gi1/0/2", "Gi1/0/3|Gi1/0/3"]
+    assert all(d["type"] == "L2" for _, _, d in G.edges(data=True))
+
+    capacity = link_capacity(G)[("SW1", "SW2")]
+    assert capacity["links"] == 3
+    assert capacity["l3_links"] == 0
+    assert capacity["total_kbps"] == 3000000
+    assert capacity["min_mtu"] == 1500
+
+
+def test_trunk_bundle_description_picks_peer():
+    sw1 = switch("SW1", [("Gi1/0/1", 1000000, 1500), ("Gi1/0/2", 1000000, 1500)])
+    sw2 = switch("SW2", [("Gi1/0/1", 1000000, 1500), ("Gi1/0/2", 1000000, 1500)])
+    sw1["interfaces"][0]["description"] = "to SW2 Gi1/0/2"
+    sw2["interfaces"][1]["description"] = "to SW1 Gi1/0/1"
+
+    G = build_topology([sw1, sw2], multigraph=True)
+    assert sorted(d["interfaces"] for _, _, d in G.edges(data=True)) == [
+        ("Gi1/0/1", "Gi1/0/2"), ("Gi1/0/2", "Gi1/0/1")]
+
+
+def test_simple_graph_l2_link_keeps_capacity():
+    G = build_topology([switch("SW1", [("Gi1/0/1", 100000, 1500)]),
+                        switch("SW2", [("Gi1/0/1", 1000000, 9000)])])
+    d = G.edges["SW1", "SW2"]
+    assert d["mtu"] == (1500, 9000)
+    assert d["bandwidth"] == (100000, 1000000)
+    assert link_capacity(G)[("SW1", "SW2")]["total_kbps"] == 100000
@@ -0,0 +1,40 @@
+"""
+Bulk-parse a directory of device configs (IOS, EOS, Junos) and dump the
+normalized devices as JSON.
+
+    python tools/parse_configs.py configs -o devices.json --workers 8
+"""
+import argparse
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.parser import PARSERS, parse_configs
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Parse device configs into normalized JSON")
+    ap.add_argument("config_dir", help="Directory containing one config file per device")
+    ap.add_argument("-o", "--output", default="-", help="Output JSON file (default: stdout)")
+    ap.add_argument("--vendor", choices=list(PARSERS), help="Skip auto-detection and force a vendor")
+    ap.add_argument("--workers", type=int, default=None, help="Parser processes (default: CPU count)")
+    args = ap.parse_args()
+
+    paths = sorted(
+        os.path.join(args.config_dir, name) for name in os.listdir(args.config_dir)
+        if os.path.isfile(os.path.join(args.config_dir, name))
+    )
+    devices = parse_configs(paths, vendor=args.vendor, max_workers=args.workers)
+
+    if args.output == "-":
+        json.dump(devices, sys.stdout, indent=2)
+    else:
+        with open(args.output, "w") as f:
+            json.dump(devices, f, indent=2)
+        print(f"Parsed {len(devices)} devices -> {args.output}")
+
+
+if __name__ == "__main__":
+    main()